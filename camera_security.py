@@ -20,6 +20,7 @@ Version: 1.0.0
 """
 
 import base64
+import functools
 import hashlib
 from typing import Optional
 
@@ -43,10 +44,14 @@ class PasswordEncryption:
     _APP_KEY = "IPCameraPlayer_SecureKey_v1.0"
     
     @classmethod
+    @functools.lru_cache(maxsize=1)
     def _get_encryption_key(cls) -> bytes:
         """
         Generate encryption key from application-specific data.
         
+        The key only depends on the application key, so it is derived once
+        and cached for every later encrypt/decrypt call.
+        
         Returns:
             Bytes representing the encryption key
         """
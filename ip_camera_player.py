@@ -19,29 +19,60 @@ Version: 1.0.0
 from PyQt5.QtWidgets import (QApplication, QMainWindow, QLabel, QPushButton,
                              QHBoxLayout, QVBoxLayout, QWidget, QFileDialog,
                              QLineEdit, QDialog, QComboBox, QStatusBar, QMessageBox,
-                             QLayout, QListWidget, QListWidgetItem, QTreeWidget, QTreeWidgetItem)
-from PyQt5.QtCore import (Qt, QThread, pyqtSignal, QPoint, QMutex, QMutexLocker,
-                          QSettings, QObject, QRect, QSize)
-from PyQt5.QtGui import (QImage, QPixmap, QCloseEvent, QIcon, QMovie,
+                             QLayout, QListWidget, QListWidgetItem, QTreeWidget, QTreeWidgetItem,
+                             QWidgetItem)
+from PyQt5.QtCore import (Qt, QThread, pyqtSignal, QPoint,
+                          QSettings, QObject, QRect, QSize, QTimer,
+                          QRunnable, QThreadPool)
+from PyQt5.QtGui import (QImage, QPixmap, QPixmapCache, QCloseEvent, QIcon, QMovie,
                          QWheelEvent, QMouseEvent)
+from PyQt5 import sip
 
 import sys
 import cv2
 import time
+import math
 import numpy as np
-from typing import Tuple, Dict, Optional
+from typing import Tuple, Dict, List, Optional
 import os
 from os import path
 from datetime import datetime
 import threading
 from enum import Enum
+from functools import partial
 import uuid
 import json
+import ast
+import queue
 from camera_security import encrypt_password, decrypt_password
 
 SW_VERSION = '1.0.0'
 CAMERA_OPENING_TIMEOUT_SECONDS = 20
 
+# Supported stream protocols, in the order offered in the camera form
+_PROTOCOLS = ('rtsp', 'http', 'https')
+_VALID_PROTOCOLS = frozenset(_PROTOCOLS)
+
+# Video resolutions offered by the legacy settings dialog, in display order
+_RES_MAP = {'1080p': (1920, 1080), '720p': (1280, 720), '480p': (640, 480)}
+
+# Wheel zoom goes in 1.1x steps between 1.1**-24 (~0.1x) and 1.1**24 (~10x);
+# factors are looked up by step so repeated ticks do not accumulate rounding
+_ZOOM_STEPS = 24
+_ZOOM_TABLE = tuple(1.1 ** i for i in range(-_ZOOM_STEPS, _ZOOM_STEPS + 1))
+
+# Directory of this module; the images shipped with the player live below it
+_MODULE_DIR = os.path.dirname(os.path.realpath(__file__))
+
+# Application logo and offline camera image, checked once at import
+_LOGO_PATH = os.path.join(_MODULE_DIR, 'images', 'Security-Camera-icon.png')
+_LOGO_EXISTS = os.path.isfile(_LOGO_PATH)
+_OFFLINE_IMAGE_PATH = os.path.join(_MODULE_DIR, 'images', 'camera-offline.png')
+_OFFLINE_IMAGE_EXISTS = os.path.isfile(_OFFLINE_IMAGE_PATH)
+
+# Window icon, loaded by _app_icon() the first time a window needs it
+_APP_ICON: Optional[QIcon] = None
+
 
 class CameraState(Enum):
     """
@@ -84,6 +115,10 @@ class CameraInstance:
         stream_thread (Optional[StreamThread]): Associated streaming thread
     """
     
+    # Configuration fields applied by update_from_dict
+    _CONFIG_FIELDS = ("name", "protocol", "username", "password", "ip_address",
+                      "port", "stream_path", "resolution", "location")
+    
     def __init__(self, 
                  camera_id: Optional[str] = None,
                  name: str = "",
@@ -155,6 +190,33 @@ class CameraInstance:
             "error_message": self.error_message
         }
     
+    def update_from_dict(self, data: Dict) -> bool:
+        """
+        Update camera configuration from a dictionary in one step.
+        
+        Only configuration fields present in data are applied; runtime state
+        is left untouched.
+        
+        Args:
+            data: Dictionary containing camera configuration (plain password)
+            
+        Returns:
+            True if any field changed, False otherwise
+        """
+        changed = False
+        for field in self._CONFIG_FIELDS:
+            if field not in data:
+                continue
+            value = data[field]
+            if field == "location":
+                value = value if value else "Default"
+            elif field == "resolution":
+                value = tuple(value)
+            if getattr(self, field) != value:
+                setattr(self, field, value)
+                changed = True
+        return changed
+    
     def get_safe_info(self) -> str:
         """
         Get safe string representation of camera for logging/display.
@@ -240,50 +302,61 @@ class CameraInstance:
         """
         return f"{self.protocol}://{self.ip_address}:{self.port}/{self.stream_path}"
     
+    def get_display_url(self) -> str:
+        """
+        Construct RTSP URL for display, with the password masked.
+        
+        Returns:
+            RTSP URL string with the username and an asterisk-masked password,
+            or without credentials if none are configured
+        """
+        if self.username and self.password:
+            return f"{self.protocol}://{self.username}:{'*' * len(self.password)}@{self.ip_address}:{self.port}/{self.stream_path}"
+        return self.get_safe_url()
+    
     def start_stream(self) -> None:
         """
         Initiate streaming for this camera.
         
-        Creates and starts a StreamThread if not already running.
-        Ensures proper cleanup of any existing thread before starting a new one.
+        The StreamThread is created on the first start only and reused on
+        every later start, so signal connections made to it stay valid.
+        Any running stream is stopped before it is started again.
         """
         # Stop any existing stream first
-        if self.stream_thread is not None:
-            if self.stream_thread.isRunning():
-                self.stream_thread.stop_streaming()
-            self.stream_thread = None
+        if self.stream_thread is not None and self.stream_thread.isRunning():
+            self.stream_thread.stop_streaming()
         
-        # Create and start new stream thread with configured timeout
         self.state = CameraState.STARTING
         self.error_message = ""
-        self.stream_thread = StreamThread(self.get_url(), self.resolution, self.id, self.connection_timeout)
-        
-        # Connect signals to update state
-        self.stream_thread.first_frame_received.connect(self._on_first_frame_received)
-        self.stream_thread.error_signal.connect(self._on_error)
+        if self.stream_thread is None:
+            self.stream_thread = StreamThread(self.get_url(), self.resolution, self.id, self.connection_timeout)
+            
+            # Connect signals to update state
+            self.stream_thread.first_frame_received.connect(self._on_first_frame_received)
+            self.stream_thread.error_signal.connect(self._on_error)
         
+        # Settings may have been edited since the thread was created
+        self.stream_thread.set_timeout(self.connection_timeout)
         self.stream_thread.start_streaming(self.get_url(), self.resolution)
     
+    def restart_stream(self) -> None:
+        """
+        Restart streaming for this camera on its existing StreamThread.
+        
+        Used to retry a camera after an error; clears the error state first.
+        """
+        self.stop_stream()
+        self.start_stream()
+    
     def stop_stream(self) -> None:
         """
         Stop streaming for this camera.
         
-        Stops and cleans up the associated StreamThread.
-        Ensures proper thread termination and resource cleanup.
+        Stops the associated StreamThread and releases its capture. The
+        thread object and its signal connections are kept for the next start.
         """
-        if self.stream_thread is not None:
-            if self.stream_thread.isRunning():
-                self.stream_thread.stop_streaming()
-            
-            # Disconnect signals to prevent memory leaks
-            try:
-                self.stream_thread.first_frame_received.disconnect()
-                self.stream_thread.error_signal.disconnect()
-            except TypeError:
-                # Signals may not be connected, ignore
-                pass
-            
-            self.stream_thread = None
+        if self.stream_thread is not None and self.stream_thread.isRunning():
+            self.stream_thread.stop_streaming()
         
         self.state = CameraState.STOPPED
         self.error_message = ""
@@ -337,6 +410,14 @@ class CameraInstance:
             self.stream_thread = new_stream_thread
             self.resolution = new_resolution
             
+            # The new thread is reused by later starts, so hand its first
+            # frame notification over to the regular state handler
+            try:
+                new_stream_thread.first_frame_received.disconnect(on_new_stream_ready)
+            except TypeError:
+                pass
+            new_stream_thread.first_frame_received.connect(self._on_first_frame_received)
+            
             # Disconnect old stream signals and stop it
             try:
                 old_stream_thread.first_frame_received.disconnect()
@@ -409,6 +490,88 @@ class CameraInstance:
             self.error_message = error_message
 
 
+class SettingsWriter(QThread):
+    """
+    Worker thread that applies QSettings writes off the GUI thread.
+    
+    Batches of values are queued by the GUI thread and written by the worker
+    through its own QSettings object opened on the same store, followed by a
+    single sync() per drained queue. The thread only runs while writes are
+    pending, so an idle writer holds no running thread.
+    
+    Attributes:
+        status (int): QSettings status reported by the last sync
+    """
+    
+    def __init__(self, settings: QSettings) -> None:
+        """
+        Initialize the SettingsWriter.
+        
+        Args:
+            settings: QSettings instance whose store the worker writes to
+        """
+        super().__init__()
+        
+        self.status = QSettings.NoError
+        self.__file_name = settings.fileName()
+        self.__format = settings.format()
+        self.__queue: queue.Queue = queue.Queue()
+        self.__lock = threading.Lock()
+        self.__active = False
+    
+    def enqueue(self, values: Dict[str, object]) -> None:
+        """
+        Queue a batch of values to be written.
+        
+        Args:
+            values: Dictionary of setting keys and values
+        """
+        with self.__lock:
+            self.__queue.put(dict(values))
+            if not self.__active:
+                self.__active = True
+                # A run() that just drained the queue may still be returning
+                self.wait()
+                self.start()
+    
+    def flush(self) -> bool:
+        """
+        Block until all queued writes have been synced.
+        
+        Returns:
+            True if the last sync succeeded, False otherwise
+        """
+        self.wait()
+        return self.status == QSettings.NoError
+    
+    def run(self) -> None:
+        """Drain the queue, write the merged values and sync once per pass."""
+        # QSettings is created here so it belongs to the worker thread
+        settings = QSettings(self.__file_name, self.__format)
+        
+        while True:
+            with self.__lock:
+                if self.__queue.empty():
+                    self.__active = False
+                    return
+                
+                # Merge every pending batch; later values win
+                pending: Dict[str, object] = {}
+                while not self.__queue.empty():
+                    pending.update(self.__queue.get_nowait())
+            
+            try:
+                for key, value in pending.items():
+                    settings.setValue(key, value)
+                settings.sync()
+                self.status = settings.status()
+            except RuntimeError:
+                # The application was torn down while a write was pending
+                with self.__lock:
+                    self.__active = False
+                return
+
+
 class CameraManager(QObject):
     """
     Manages the collection of camera instances and handles persistence.
@@ -431,6 +594,9 @@ class CameraManager(QObject):
     cameras_reordered = pyqtSignal()
     selection_changed = pyqtSignal(str)
     
+    # Delay before pending settings changes are synced to disk
+    SETTINGS_FLUSH_DELAY_MS = 500
+    
     def __init__(self, settings: QSettings):
         """
         Initialize the CameraManager.
@@ -442,6 +608,21 @@ class CameraManager(QObject):
         self.cameras: list[CameraInstance] = []
         self.settings = settings
         self.selected_camera_id: Optional[str] = None
+        
+        # Position of each camera in self.cameras, rebuilt by index_of when stale
+        self._id_to_index: Dict[str, int] = {}
+        
+        # Values last written to QSettings; unchanged values are not rewritten
+        self._settings_cache: Dict[str, object] = {}
+        
+        # Optional background writer; when set, writes leave the GUI thread
+        self._settings_writer: Optional[SettingsWriter] = None
+        
+        # Debounce timer so a burst of saves results in a single sync()
+        self._flush_timer = QTimer(self)
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.setInterval(self.SETTINGS_FLUSH_DELAY_MS)
+        self._flush_timer.timeout.connect(self.flush_settings)
     
     def add_camera(self, config: Dict) -> Optional[str]:
         """
@@ -453,34 +634,55 @@ class CameraManager(QObject):
         Returns:
             Camera ID if successful, None if validation fails
         """
+        return self.add_cameras([config])[0]
+    
+    def add_cameras(self, configs: List[Dict]) -> List[Optional[str]]:
+        """
+        Add several camera instances, persisting them with a single save.
+        
+        Args:
+            configs: Dictionaries containing camera configurations
+            
+        Returns:
+            Camera ID for each configuration, None where validation fails
+        """
         # Validate required fields
         required_fields = ["name", "ip_address"]
-        for field in required_fields:
-            if not config.get(field):
-                return None
-        
-        # Create camera instance
-        camera = CameraInstance(
-            name=config.get("name", ""),
-            protocol=config.get("protocol", "rtsp"),
-            username=config.get("username", ""),
-            password=config.get("password", ""),
-            ip_address=config.get("ip_address", ""),
-            port=config.get("port", 554),
-            stream_path=config.get("stream_path", ""),
-            resolution=config.get("resolution", (1920, 1080)),
-            location=config.get("location", "Default")
-        )
+        added = []
+        camera_ids = []
+        for config in configs:
+            if not all(config.get(field) for field in required_fields):
+                camera_ids.append(None)
+                continue
+            
+            # Create camera instance
+            camera = CameraInstance(
+                name=config.get("name", ""),
+                protocol=config.get("protocol", "rtsp"),
+                username=config.get("username", ""),
+                password=config.get("password", ""),
+                ip_address=config.get("ip_address", ""),
+                port=config.get("port", 554),
+                stream_path=config.get("stream_path", ""),
+                resolution=config.get("resolution", (1920, 1080)),
+                location=config.get("location", "Default")
+            )
+            added.append(camera)
+            camera_ids.append(camera.id)
+        
+        if not added:
+            return camera_ids
         
-        self.cameras.append(camera)
+        self.cameras.extend(added)
         
         # Attempt to save settings
         if not self.save_to_settings():
             print("Warning: Failed to persist camera addition to storage")
         
-        self.camera_added.emit(camera.id)
+        for camera in added:
+            self.camera_added.emit(camera.id)
         
-        return camera.id
+        return camera_ids
     
     def remove_camera(self, camera_id: str) -> bool:
         """
@@ -525,10 +727,27 @@ class CameraManager(QObject):
         Returns:
             CameraInstance if found, None otherwise
         """
-        for camera in self.cameras:
-            if camera.id == camera_id:
-                return camera
-        return None
+        index = self.index_of(camera_id)
+        return self.cameras[index] if index >= 0 else None
+    
+    def index_of(self, camera_id: str) -> int:
+        """
+        Return the position of a camera in the camera list.
+        
+        Positions are cached by ID; the cache is rebuilt whenever an entry no
+        longer matches the list, so any change to the list is picked up.
+        
+        Args:
+            camera_id: ID of camera to look up
+            
+        Returns:
+            Index of the camera, or -1 if not found
+        """
+        index = self._id_to_index.get(camera_id)
+        if index is None or index >= len(self.cameras) or self.cameras[index].id != camera_id:
+            self._id_to_index = {camera.id: i for i, camera in enumerate(self.cameras)}
+            index = self._id_to_index.get(camera_id)
+        return -1 if index is None else index
     
     def get_all_cameras(self) -> list[CameraInstance]:
         """
@@ -603,16 +822,99 @@ class CameraManager(QObject):
         """
         Persist all cameras to QSettings with error handling.
         
+        Values are written through an in-memory cache: keys whose value has
+        not changed are skipped, and the sync to disk is deferred by
+        SETTINGS_FLUSH_DELAY_MS so several saves in a row share one sync.
+        Call flush_settings() to force the sync immediately.
+        
+        With a SettingsWriter set, the values are only queued for the writer,
+        and errors from its sync are reported by flush_settings().
+        
         Returns:
-            True if successful, False if error occurred
+            True if successful (or queued), False if error occurred
         """
         try:
             cameras_data = [camera.to_dict() for camera in self.cameras]
-            self.settings.setValue('cameras', json.dumps(cameras_data))
+            values = {'cameras': json.dumps(cameras_data)}
             if self.selected_camera_id:
-                self.settings.setValue('selected_camera_id', self.selected_camera_id)
+                values['selected_camera_id'] = self.selected_camera_id
+            
+            self._write_settings(values)
+            
+            # The writer has not synced this save yet, so its status would
+            # describe an older one
+            if self._settings_writer is not None:
+                return True
+            
+            # Report any error left by the last sync
+            status = self.settings_status()
+            if status != 0:  # QSettings.NoError = 0
+                print(f"Warning: QSettings sync reported status code {status}")
+                return False
             
-            # Sync to ensure data is written to disk
+            return True
+        except Exception as e:
+            print(f"Error saving camera settings: {e}")
+            return False
+    
+    def set_settings_writer(self, writer: Optional[SettingsWriter]) -> None:
+        """
+        Route settings writes through a background SettingsWriter.
+        
+        Args:
+            writer: SettingsWriter to use, or None to write on the calling thread
+        """
+        self._settings_writer = writer
+    
+    def settings_status(self) -> int:
+        """
+        Return the QSettings status of the last write.
+        
+        Returns:
+            QSettings status code (0 means no error)
+        """
+        if self._settings_writer is not None:
+            return self._settings_writer.status
+        return self.settings.status()
+    
+    def _write_settings(self, values: Dict[str, object]) -> None:
+        """
+        Write changed values to QSettings and schedule a deferred sync.
+        
+        Args:
+            values: Dictionary of setting keys and values to persist
+        """
+        changed = {key: value for key, value in values.items()
+                   if self._settings_cache.get(key) != value}
+        if not changed:
+            return
+        
+        self._settings_cache.update(changed)
+        
+        if self._settings_writer is not None:
+            self._settings_writer.enqueue(changed)
+            return
+        
+        for key, value in changed.items():
+            self.settings.setValue(key, value)
+        self._flush_timer.start()
+    
+    def flush_settings(self) -> bool:
+        """
+        Sync pending settings changes to disk immediately.
+        
+        Returns:
+            True if successful, False if error occurred
+        """
+        self._flush_timer.stop()
+        
+        if self._settings_writer is not None:
+            if not self._settings_writer.flush():
+                print(f"Warning: QSettings sync reported status code {self._settings_writer.status}")
+                return False
+            return True
+        
+        try:
             self.settings.sync()
             
             # Check if sync was successful
@@ -623,7 +925,7 @@ class CameraManager(QObject):
             
             return True
         except Exception as e:
-            print(f"Error saving camera settings: {e}")
+            print(f"Error syncing camera settings: {e}")
             return False
     
     def load_from_settings(self) -> bool:
@@ -718,13 +1020,7 @@ def migrate_settings(settings: QSettings) -> None:
         
         # Handle video resolution
         video_resolution_str = settings.value('video_resolution', '', type=str)
-        if video_resolution_str:
-            try:
-                resolution = eval(video_resolution_str)
-            except:
-                resolution = (1920, 1080)
-        else:
-            resolution = (1920, 1080)
+        resolution = parse_resolution(video_resolution_str)
         
         # Create migrated camera configuration with encrypted password
         migrated_camera = {
@@ -751,6 +1047,99 @@ def migrate_settings(settings: QSettings) -> None:
         for key in old_keys:
             if settings.contains(key):
                 settings.remove(key)
+    
+    # Convert the legacy "(w, h)" resolution string into two integer keys
+    if settings.contains('video_resolution'):
+        width, height = parse_resolution(settings.value('video_resolution', '', type=str))
+        settings.setValue('res_w', width)
+        settings.setValue('res_h', height)
+        settings.remove('video_resolution')
+
+
+def parse_resolution(resolution_str: str, default: Tuple[int, int] = (1920, 1080)) -> Tuple[int, int]:
+    """
+    Parse a legacy "(width, height)" resolution string.
+    
+    Uses ast.literal_eval so only a literal tuple is accepted; nothing in
+    the string is executed.
+    
+    Args:
+        resolution_str: Resolution string as stored by older versions
+        default: Resolution returned if the string is empty or malformed
+        
+    Returns:
+        Resolution as (width, height) tuple
+    """
+    if not resolution_str:
+        return default
+    
+    try:
+        width, height = ast.literal_eval(resolution_str)
+        return int(width), int(height)
+    except (ValueError, TypeError, SyntaxError):
+        return default
+
+
+def _app_icon() -> QIcon:
+    """
+    Return the application icon, loading it on first use.
+    
+    Returns:
+        QIcon: The icon shared by every window
+    """
+    global _APP_ICON
+    if _APP_ICON is None:
+        _APP_ICON = QIcon(_LOGO_PATH)
+    return _APP_ICON
+
+
+# Qt 5.14+ can display OpenCV's BGR frames without a color conversion
+_HAS_BGR888 = hasattr(QImage, 'Format_BGR888')
+
+
+def frame_to_qimage(frame: np.ndarray) -> QImage:
+    """
+    Wrap a BGR video frame (or a row/column slice of one) in a QImage.
+    
+    With Format_BGR888 the QImage shares the frame's buffer, using the
+    frame's row stride as bytes per line, so the caller must keep the frame
+    alive until the image has been converted to a pixmap. Frames whose
+    pixels are not packed within a row (e.g. views taken with a step) are
+    packed once here and the QImage owns that copy. Older Qt versions fall
+    back to an RGB converted copy.
+    
+    Args:
+        frame: Video frame as numpy array (BGR format)
+        
+    Returns:
+        QImage showing the frame
+    """
+    h, w = frame.shape[:2]
+    if _HAS_BGR888:
+        if frame.strides[1:] == (3, 1):
+            return QImage(sip.voidptr(frame.ctypes.data), w, h, frame.strides[0], QImage.Format_BGR888)
+        packed = np.ascontiguousarray(frame)
+        return QImage(packed.data, w, h, packed.strides[0], QImage.Format_BGR888).copy()
+    
+    frame_rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+    return QImage(frame_rgb.data, w, h, frame_rgb.strides[0], QImage.Format_RGB888).copy()
+
+
+def _fit_size(width: int, height: int, max_width: int, max_height: int) -> Tuple[int, int]:
+    """
+    Compute the size of a frame scaled to fit a box while keeping its aspect ratio.
+    
+    Args:
+        width: Frame width
+        height: Frame height
+        max_width: Width of the box to fit in
+        max_height: Height of the box to fit in
+        
+    Returns:
+        Tuple[int, int]: The scaled (width, height), at least 1x1
+    """
+    scale = min(max_width / width, max_height / height)
+    return max(1, round(width * scale)), max(1, round(height * scale))
 
 
 class CameraPanel(QWidget):
@@ -790,10 +1179,15 @@ class CameraPanel(QWidget):
         self.camera_instance = camera_instance
         self.is_selected = False
         self.is_fullscreen = False
+        self.zoom_level = 0  # Wheel steps from no zoom
         self.zoom_factor = 1.0
         self.pan_offset = QPoint(0, 0)
         self.accepting_frames = False  # Flag to control frame updates
         
+        # Loading animation, created the first time it is shown
+        self._loading_animation: Optional['LoadingAnimation'] = None
+        self.is_loading = False
+        
         # Panning state
         self.panning = False
         self.last_mouse_position = QPoint(0, 0)
@@ -809,9 +1203,12 @@ class CameraPanel(QWidget):
         self.video_label.setContentsMargins(0, 0, 0, 0)
         
         # Load and display offline image by default
-        offline_image_path = os.path.dirname(os.path.realpath(__file__)) + "/images/camera-offline.png"
-        if os.path.exists(offline_image_path):
-            self.offline_pixmap = QPixmap(offline_image_path)
+        if _OFFLINE_IMAGE_EXISTS:
+            # Every panel shares one decoded copy of the offline image
+            self.offline_pixmap = QPixmapCache.find(_OFFLINE_IMAGE_PATH)
+            if self.offline_pixmap is None:
+                self.offline_pixmap = QPixmap(_OFFLINE_IMAGE_PATH)
+                QPixmapCache.insert(_OFFLINE_IMAGE_PATH, self.offline_pixmap)
             # Display offline image initially
             self.show_offline_image()
         else:
@@ -889,13 +1286,6 @@ class CameraPanel(QWidget):
             }
         """)
         
-        # Create loading animation
-        self.loading_animation = LoadingAnimation(
-            self,
-            "/images/Spinner-1s-104px.gif",
-            (104, 104)
-        )
-        
         # Setup layout
         layout = QVBoxLayout(self)
         layout.setContentsMargins(0, 0, 0, 0)
@@ -930,64 +1320,48 @@ class CameraPanel(QWidget):
         if frame is None:
             return
         
-        # Convert frame to RGB format
-        frame_rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-        
-        # Get frame dimensions
-        h, w, ch = frame_rgb.shape
-        bytes_per_line = ch * w
-        
-        # Create QImage from frame
-        q_image = QImage(frame_rgb.data, w, h, bytes_per_line, QImage.Format_RGB888)
-        pixmap = QPixmap.fromImage(q_image)
-        
-        # Scale to fill the panel while maintaining aspect ratio
-        # This ensures the video fits perfectly within the panel
-        scaled_pixmap = pixmap.scaledToWidth(
-            self.video_label.width(),
-            Qt.SmoothTransformation
-        )
-        
-        # If scaled height is still larger than label height, scale by height instead
-        if scaled_pixmap.height() > self.video_label.height():
-            scaled_pixmap = pixmap.scaledToHeight(
-                self.video_label.height(),
-                Qt.SmoothTransformation
-            )
-        
-        # Apply zoom factor
-        self.scaled_width = int(self.zoom_factor * scaled_pixmap.width())
-        self.scaled_height = int(self.zoom_factor * scaled_pixmap.height())
-        
-        # Scale pixmap with zoom factor
-        if self.zoom_factor != 1.0:
-            scaled_pixmap = scaled_pixmap.scaled(
+        # Let the stream thread pre-scale the next frames to this panel
+        stream_thread = self.camera_instance.stream_thread
+        if stream_thread is not None:
+            stream_thread.set_display_size(self.video_label.width(), self.video_label.height())
+        
+        # Wrap the BGR frame without a color conversion copy
+        image = frame_to_qimage(frame)
+        label_width = self.video_label.width()
+        label_height = self.video_label.height()
+        
+        # Fit the frame inside the panel keeping its aspect ratio and apply the
+        # zoom factor, so the frame is scaled at most once. Frames pre-scaled
+        # by the stream thread already fit and are not scaled again.
+        fit_width, fit_height = _fit_size(image.width(), image.height(), label_width, label_height)
+        self.scaled_width = int(self.zoom_factor * fit_width)
+        self.scaled_height = int(self.zoom_factor * fit_height)
+        if (self.scaled_width, self.scaled_height) != (image.width(), image.height()):
+            image = image.scaled(
                 self.scaled_width,
                 self.scaled_height,
                 Qt.IgnoreAspectRatio,
                 Qt.SmoothTransformation
             )
-        else:
-            self.scaled_width = scaled_pixmap.width()
-            self.scaled_height = scaled_pixmap.height()
         
         # Enforce boundary limits for panning
-        max_x_offset = max(0, self.scaled_width - self.video_label.width())
-        max_y_offset = max(0, self.scaled_height - self.video_label.height())
+        max_x_offset = max(0, self.scaled_width - label_width)
+        max_y_offset = max(0, self.scaled_height - label_height)
         
         x_offset = max(0, min(self.pan_offset.x(), max_x_offset))
         y_offset = max(0, min(self.pan_offset.y(), max_y_offset))
         
-        # Create visible portion based on panning
-        visible_pixmap = scaled_pixmap.copy(
-            x_offset,
-            y_offset,
-            self.video_label.width(),
-            self.video_label.height()
-        )
+        # Crop to the visible portion only when the zoomed frame overflows the panel
+        if max_x_offset or max_y_offset:
+            image = image.copy(
+                x_offset,
+                y_offset,
+                min(label_width, self.scaled_width),
+                min(label_height, self.scaled_height)
+            )
         
         # Display the frame
-        self.video_label.setPixmap(visible_pixmap)
+        self.video_label.setPixmap(QPixmap.fromImage(image))
     
     def set_selected(self, selected: bool) -> None:
         """
@@ -999,6 +1373,17 @@ class CameraPanel(QWidget):
         self.is_selected = selected
         self.update()  # Trigger repaint to show/hide selection border
     
+    @property
+    def loading_animation(self) -> 'LoadingAnimation':
+        """Loading animation of the panel, created on first use."""
+        if self._loading_animation is None:
+            self._loading_animation = LoadingAnimation(
+                self,
+                "/images/Spinner-1s-104px.gif",
+                (104, 104)
+            )
+        return self._loading_animation
+    
     def set_loading(self, loading: bool) -> None:
         """
         Show or hide the loading animation.
@@ -1006,17 +1391,19 @@ class CameraPanel(QWidget):
         Args:
             loading: True to show loading animation, False to hide
         """
+        self.is_loading = loading
         if loading:
             self.loading_animation.start()
             self.error_label.hide()
-        else:
-            self.loading_animation.stop()
+        elif self._loading_animation is not None:
+            self._loading_animation.stop()
     
     def show_offline_image(self) -> None:
         """Display the offline camera image."""
         # Stop loading animation (if it exists)
-        if hasattr(self, 'loading_animation'):
-            self.loading_animation.stop()
+        self.is_loading = False
+        if self._loading_animation is not None:
+            self._loading_animation.stop()
         
         if not self.offline_pixmap:
             self.video_label.setStyleSheet("background-color: #404040;")
@@ -1036,12 +1423,18 @@ class CameraPanel(QWidget):
             self.video_label.setAlignment(Qt.AlignCenter)
             return
         
-        # Scale the offline image to fit while maintaining aspect ratio
-        scaled_pixmap = self.offline_pixmap.scaled(
-            target_size,
-            Qt.KeepAspectRatio,
-            Qt.SmoothTransformation
-        )
+        # Scale the offline image to fit while maintaining aspect ratio. Panels
+        # of the same size share the scaled image, so idle grids and repeated
+        # resizes to a known size do not rescale it again.
+        key = f"offline:{self.offline_pixmap.cacheKey()}:{target_size.width()}x{target_size.height()}"
+        scaled_pixmap = QPixmapCache.find(key)
+        if scaled_pixmap is None:
+            scaled_pixmap = self.offline_pixmap.scaled(
+                target_size,
+                Qt.KeepAspectRatio,
+                Qt.SmoothTransformation
+            )
+            QPixmapCache.insert(key, scaled_pixmap)
         self.video_label.setPixmap(scaled_pixmap)
         self.video_label.setAlignment(Qt.AlignCenter)
     
@@ -1061,7 +1454,7 @@ class CameraPanel(QWidget):
             
             # Then display the error message on top
             self.error_label.setText(message)
-            self.loading_animation.stop()
+            self.set_loading(False)
             
             # Position error container in center (this will set size)
             self._position_error_container()
@@ -1230,14 +1623,14 @@ class CameraPanel(QWidget):
         Args:
             event: Wheel event
         """
-        # Adjust zoom factor based on wheel direction
-        if event.angleDelta().y() > 0:
-            self.zoom_factor *= 1.1  # Zoom in
-        else:
-            self.zoom_factor /= 1.1  # Zoom out
+        # Step the zoom level based on wheel direction, within the zoom range
+        step = 1 if event.angleDelta().y() > 0 else -1
+        level = max(-_ZOOM_STEPS, min(self.zoom_level + step, _ZOOM_STEPS))
+        if level == self.zoom_level:
+            return
         
-        # Ensure zoom factor stays within reasonable range
-        self.zoom_factor = max(0.1, min(self.zoom_factor, 10.0))
+        self.zoom_level = level
+        self.zoom_factor = _ZOOM_TABLE[level + _ZOOM_STEPS]
     
     def _start_drag(self) -> None:
         """Initiate a drag operation for reordering."""
@@ -1404,6 +1797,25 @@ class CameraGridLayout(QLayout):
             return item
         return None
     
+    @staticmethod
+    def calculate_grid_dimensions(count: int) -> Tuple[int, int]:
+        """
+        Compute the smallest near-square grid that holds a number of panels.
+        
+        Rows are the integer square root of the count and columns are as many
+        as needed for the rest, so grids are never taller than they are wide.
+        
+        Args:
+            count: Number of camera panels
+            
+        Returns:
+            Tuple[int, int]: Grid (rows, columns), (0, 0) for no panels
+        """
+        if count <= 0:
+            return 0, 0
+        rows = math.isqrt(count)
+        return rows, -(-count // rows)
+    
     def setGeometry(self, rect):
         """
         Position all camera panels in a fixed 3x3 grid within the given rectangle.
@@ -1529,6 +1941,16 @@ class CameraGridLayout(QLayout):
         self.fullscreen_item = None
         self.invalidate()
     
+    def set_items(self, items):
+        """
+        Replace the panel order in one step, with a single relayout.
+        
+        Args:
+            items: The layout's QLayoutItems in their new order
+        """
+        self.items = list(items)
+        self.invalidate()
+    
     def swap_items(self, index1, index2):
         """
         Swap the positions of two panels.
@@ -1574,7 +1996,7 @@ class LoadingAnimation:
         self.label.setContentsMargins(0, 0, 0, 0)
 
         # Load the GIF using QMovie
-        file_name = os.path.dirname(os.path.realpath(__file__)) + gif_path
+        file_name = _MODULE_DIR + gif_path
         if path.exists(file_name):
             self.movie = QMovie(file_name)
 
@@ -1640,6 +2062,8 @@ class StreamThread(QThread):
         # Class fields
         self.__url = url
         self.__cap = None
+        # Guards releasing the capture, which both run() and stop_streaming() do
+        self.__cap_lock = threading.Lock()
         self.__stream_is_running = False
         self.__stream_is_paused = False
         self.__video_resolution = video_res
@@ -1647,6 +2071,12 @@ class StreamThread(QThread):
         self.__resize_frame = False
         self.__timeout = timeout
         self.__camera_id = camera_id
+        # Size of the panel showing this stream; frames are pre-scaled to it
+        # here so the GUI thread does not have to
+        self.__display_size: Optional[Tuple[int, int]] = None
+        # Set while stop_streaming() is tearing the thread down so the run
+        # loop does not queue status updates that would only be drained later
+        self.__stopping = False
 
     def run(self) -> None:
         """
@@ -1656,8 +2086,11 @@ class StreamThread(QThread):
        It emits signals for frames and various status updates.
        """
 
-        # Start camera initialization in a separate thread
-        init_thread = threading.Thread(target=self.initialize_camera)
+        # Start camera initialization in a separate thread. The capture comes
+        # back through a holder owned by this run, so an attempt abandoned by
+        # an earlier run of this (reused) thread cannot hand its capture over
+        holder: Dict[str, object] = {}
+        init_thread = threading.Thread(target=self.initialize_camera, args=(holder,))
         init_thread.start()
 
         # Wait for the thread to complete or timeout
@@ -1665,6 +2098,13 @@ class StreamThread(QThread):
 
         # If the thread is still alive after the timeout, handle it as a failure
         if init_thread.is_alive():
+            # The attempt releases its capture itself if it opens one later;
+            # one that arrived since the timeout is released here
+            with self.__cap_lock:
+                holder["abandoned"] = True
+                late_cap = holder.pop("cap", None)
+            if late_cap is not None:
+                late_cap.release()
             self.error_signal.emit(
                 self.__camera_id, 
                 f"Connection timeout: Failed to connect to camera within {self.__timeout} seconds. "
@@ -1673,6 +2113,9 @@ class StreamThread(QThread):
             self.stop_streaming()
             return
 
+        with self.__cap_lock:
+            self.__cap = holder.get("cap")
+
         # If camera initialization failed, stop the thread
         if not self.__cap or not self.__cap.isOpened():
             # self.error_signal.emit(f"Failed to open camera stream: {self.__url}")
@@ -1683,18 +2126,25 @@ class StreamThread(QThread):
         # Reduce buffer size for low latency
         self.__cap.set(cv2.CAP_PROP_BUFFERSIZE, 1)
 
+        # Get the desired frame width and height
+        desired_frame_width, desired_frame_height = self.__video_resolution
+        print(f'requested camera resolution: {self.__video_resolution}')
+
+        # Ask the backend to deliver frames at the desired resolution, so they
+        # do not have to be decoded at full size and scaled down afterwards.
+        # Backends that cannot do this ignore the request.
+        self.__cap.set(cv2.CAP_PROP_FRAME_WIDTH, desired_frame_width)
+        self.__cap.set(cv2.CAP_PROP_FRAME_HEIGHT, desired_frame_height)
+
         # Get the stream width and height
         frame_width = self.__cap.get(cv2.CAP_PROP_FRAME_WIDTH)
         frame_height = self.__cap.get(cv2.CAP_PROP_FRAME_HEIGHT)
         print(f'camera resolution: {frame_width, frame_height}')
 
-        # Get the desired frame width and height
-        desired_frame_width, desired_frame_height = self.__video_resolution
-        print(f'requested camera resolution: {self.__video_resolution}')
-
-        # Decide if we have to resize the frame
-        if desired_frame_width != frame_width or desired_frame_height != frame_height:
-            self.__resize_frame = True
+        # Decide if we have to resize the frame (the thread may be restarted
+        # with a different resolution, so the flag is recomputed every run)
+        self.__resize_frame = desired_frame_width != frame_width or desired_frame_height != frame_height
+        if self.__resize_frame:
             print('Resizing frames')
 
         while self.__stream_is_running:
@@ -1707,7 +2157,10 @@ class StreamThread(QThread):
                         break
 
                     # Resize frame for faster processing
-                    if self.__resize_frame:
+                    display_size = self.__display_size
+                    if display_size is not None:
+                        frame = self.__fit_frame(frame, display_size)
+                    elif self.__resize_frame:
                         frame = cv2.resize(frame, self.__video_resolution)
 
                     # Emit a signal carrying the frame.
@@ -1715,17 +2168,60 @@ class StreamThread(QThread):
 
                     # Notify when the first frame was received.
                     if not self.__first_frame_was_received:
-                        self.status_signal.emit(self.__camera_id, 'Streaming started')
+                        if not self.__stopping:
+                            self.status_signal.emit(self.__camera_id, 'Streaming started')
                         # print('Streaming started')
                         self.first_frame_received.emit(self.__camera_id)
                         self.__first_frame_was_received = True
             else:
                 time.sleep(0.01)  # Sleep briefly to avoid busy-waiting
-        # self.stop_streaming()
+        
+        # The loop also ends on a read error, so leave the thread ready to be
+        # started again and free the capture here
+        self.__stream_is_running = False
+        self.__release_capture()
+
+    @staticmethod
+    def __fit_frame(frame: np.ndarray, display_size: Tuple[int, int]) -> np.ndarray:
+        """
+        Scale a frame to fit the display size while keeping its aspect ratio.
+        
+        Args:
+            frame: Video frame as numpy array
+            display_size: Target (width, height)
+            
+        Returns:
+            The scaled frame, or the frame itself if it already fits exactly
+        """
+        h, w = frame.shape[:2]
+        size = _fit_size(w, h, *display_size)
+        if size == (w, h):
+            return frame
+        interpolation = cv2.INTER_AREA if size[0] < w else cv2.INTER_LINEAR
+        return cv2.resize(frame, size, interpolation=interpolation)
 
-    def initialize_camera(self):
-        """Camera initialization logic that runs in a separate thread"""
-        self.__cap = cv2.VideoCapture(self.__url)
+    def __release_capture(self) -> None:
+        """Release the capture once, whichever thread gets here first."""
+        with self.__cap_lock:
+            cap, self.__cap = self.__cap, None
+        if cap is not None:
+            cap.release()
+
+    def initialize_camera(self, holder: Dict[str, object]) -> None:
+        """
+        Camera initialization logic that runs in a separate thread.
+
+        Args:
+            holder: Dictionary of the run that started this attempt; receives
+                the capture under "cap" unless the run has abandoned it
+        """
+        cap = cv2.VideoCapture(self.__url)
+        with self.__cap_lock:
+            if not holder.get("abandoned"):
+                holder["cap"] = cap
+                return
+        # The run timed out waiting for this attempt; do not keep the session open
+        cap.release()
 
     def start_streaming(self, url: str, res: Tuple[int, int]) -> None:
         if not self.__stream_is_running:
@@ -1733,22 +2229,35 @@ class StreamThread(QThread):
             self.__video_resolution = res
             self.__stream_is_running = True
             self.__stream_is_paused = False
+            self.__stopping = False
             self.start()  # Begins execution of the thread by calling run()
             self.status_signal.emit(self.__camera_id, 'Starting streaming')
         self.__first_frame_was_received = False
 
+    def set_timeout(self, timeout: int) -> None:
+        """
+        Set the connection timeout used by the next start of the stream.
+
+        Args:
+            timeout: Connection timeout in seconds
+        """
+        self.__timeout = timeout
+
     def stop_streaming(self) -> None:
-        self.status_signal.emit(self.__camera_id, 'Stopping streaming')
+        self.__stopping = True
         self.__stream_is_running = False
         # Terminate the thread.
         self.quit()
         self.wait()
         # Release resources
-        if self.__cap is not None:
-            self.__cap.release()
-            self.__cap = None
+        self.__release_capture()
+        # Single status update once the thread has actually stopped
+        self.status_signal.emit(self.__camera_id, 'Streaming stopped')
 
     def pause_streaming(self, pause: bool) -> None:
+        # Nothing to report if the pause state is unchanged
+        if self.__stream_is_paused == pause:
+            return
         if pause:
             self.__stream_is_paused = True
             self.status_signal.emit(self.__camera_id, 'Streaming paused')
@@ -1771,13 +2280,79 @@ class StreamThread(QThread):
     def set_camera_id(self, camera_id: str) -> None:
         self.__camera_id = camera_id
 
+    def set_display_size(self, width: int, height: int) -> None:
+        # Ignore sizes of panels that are not laid out yet
+        self.__display_size = (width, height) if width > 0 and height > 0 else None
+
     def get_camera_id(self) -> str:
         return self.__camera_id
 
 
-class CameraSettings(QDialog):
+class SnapshotSaveSignals(QObject):
     """
-    Dialog for configuring camera connection settings.
+    Signals of a SnapshotSaveTask, which is not a QObject itself.
+    
+    Signals:
+        finished: Emitted with (camera_name, path, success) once the file is written
+    """
+    
+    finished = pyqtSignal(str, str, bool)
+
+
+class SnapshotSaveTask(QRunnable):
+    """
+    Pool task that encodes and writes a snapshot image off the GUI thread.
+    
+    Attributes:
+        signals (SnapshotSaveSignals): Signals reporting the result
+    """
+    
+    def __init__(self, image: QImage, path: str, camera_name: str) -> None:
+        """
+        Initialize the SnapshotSaveTask.
+        
+        Args:
+            image: Image to save; QImage (unlike QPixmap) may be used from any thread
+            path: Destination file path
+            camera_name: Name of the camera the snapshot was taken from
+        """
+        super().__init__()
+        
+        self.signals = SnapshotSaveSignals()
+        self.__image = image
+        self.__path = path
+        self.__camera_name = camera_name
+    
+    def run(self) -> None:
+        """Save the image as PNG and report the result."""
+        saved = self.__image.save(self.__path, 'PNG')
+        self.signals.finished.emit(self.__camera_name, self.__path, saved)
+
+
+class StreamStopTask(QRunnable):
+    """
+    Pool task that stops a StreamThread, so several streams can be joined at once.
+    """
+    
+    def __init__(self, stream_thread: StreamThread) -> None:
+        """
+        Initialize the StreamStopTask.
+        
+        Args:
+            stream_thread: Stream thread to stop
+        """
+        super().__init__()
+        
+        self.__stream_thread = stream_thread
+    
+    def run(self) -> None:
+        """Stop the stream thread and wait for it to finish."""
+        self.__stream_thread.stop_streaming()
+
+
+class CameraSettings(QDialog):
+    """
+    Dialog for configuring camera connection settings.
 
     This class provides a dialog interface for users to input and modify
     camera connection parameters.
@@ -1830,14 +2405,10 @@ class CameraSettings(QDialog):
         self.stream_path_line_edit.setText(parent.stream_path)
 
         self.video_res_combo_box = QComboBox(self)
-        video_res = ['1080p', '720p', '480p']
-        self.video_res_combo_box.addItems(video_res)
-        if parent.video_resolution == (1920, 1080):
-            self.video_res_combo_box.setCurrentIndex(0)
-        elif parent.video_resolution == (1280, 720):
-            self.video_res_combo_box.setCurrentIndex(1)
-        elif parent.video_resolution == (640, 480):
-            self.video_res_combo_box.setCurrentIndex(2)
+        self.video_res_combo_box.addItems(_RES_MAP)
+        resolutions = list(_RES_MAP.values())
+        if parent.video_resolution in resolutions:
+            self.video_res_combo_box.setCurrentIndex(resolutions.index(parent.video_resolution))
         else:
             self.video_res_combo_box.setCurrentIndex(0)
 
@@ -1964,7 +2535,7 @@ class CameraConfigDialog(QDialog):
         self.location_line_edit.setMinimumHeight(30)
         
         self.protocol_combo_box = QComboBox(self)
-        self.protocol_combo_box.addItems(['rtsp', 'http', 'https'])
+        self.protocol_combo_box.addItems(_PROTOCOLS)
         self.protocol_combo_box.setMinimumHeight(30)
         
         self.username_line_edit = QLineEdit(self)
@@ -2068,6 +2639,32 @@ class CameraConfigDialog(QDialog):
         self.setWindowTitle(title)
         self.setFixedSize(500, 420)
     
+    def reset(self, camera_instance: Optional[CameraInstance] = None):
+        """
+        Reset the form so the dialog can be reused for another camera.
+        
+        Args:
+            camera_instance: Optional CameraInstance to edit (None for add mode)
+        """
+        self.camera_instance = camera_instance
+        self.is_edit_mode = camera_instance is not None
+        
+        self._clear_error_styling()
+        
+        # Restore add mode defaults
+        for widget in [self.name_line_edit, self.username_line_edit, self.password_line_edit,
+                       self.ip_address_line_edit, self.stream_path_line_edit]:
+            widget.clear()
+        self.location_line_edit.setText('Default')
+        self.port_line_edit.setText('554')
+        self.protocol_combo_box.setCurrentIndex(0)
+        self.resolution_combo_box.setCurrentIndex(0)
+        
+        if self.is_edit_mode:
+            self.load_camera(camera_instance)
+        
+        self.setWindowTitle("Edit Camera" if self.is_edit_mode else "Add Camera")
+    
     def load_camera(self, camera_instance: CameraInstance):
         """
         Populate form with existing camera data.
@@ -2192,7 +2789,7 @@ class CameraConfigDialog(QDialog):
             return False, "Port must be between 1 and 65535"
         
         # Validate protocol
-        if data["protocol"] not in ['rtsp', 'http', 'https']:
+        if data["protocol"] not in _VALID_PROTOCOLS:
             return False, "Protocol must be rtsp, http, or https"
         
         # Validate stream path (optional but if provided, check for invalid characters)
@@ -2232,6 +2829,106 @@ class CameraConfigDialog(QDialog):
             widget.setStyleSheet("")
 
 
+# Stylesheets shared by every CameraListWidget instance
+_LIST_DIALOG_QSS = """
+    QDialog {
+        background-color: #1E1E1E;
+        color: #FFFFFF;
+    }
+"""
+
+_CAMERA_LIST_QSS = """
+    QListWidget {
+        background-color: #2D2D2D;
+        color: #FFFFFF;
+        border: 1px solid #3F3F3F;
+        border-radius: 4px;
+        padding: 5px;
+        font-size: 13px;
+    }
+    QListWidget::item {
+        padding: 8px;
+        border-bottom: 1px solid #3F3F3F;
+    }
+    QListWidget::item:selected {
+        background-color: rgba(0, 120, 215, 0.3);
+        color: #FFFFFF;
+    }
+    QListWidget::item:hover {
+        background-color: #3F3F3F;
+    }
+"""
+
+_BUTTON_QSS = """
+    QPushButton {
+        background-color: #2D2D2D;
+        color: #FFFFFF;
+        border: 1px solid #3F3F3F;
+        padding: 10px 20px;
+        border-radius: 4px;
+        font-size: 12px;
+        font-weight: 600;
+        min-width: 100px;
+    }
+    QPushButton:hover {
+        background-color: #3F3F3F;
+        border: 1px solid #0078D7;
+    }
+    QPushButton:pressed {
+        background-color: #0078D7;
+        border: 1px solid #0078D7;
+    }
+    QPushButton:disabled {
+        background-color: #1E1E1E;
+        color: rgba(255, 255, 255, 0.5);
+        border: 1px solid #2D2D2D;
+    }
+"""
+
+_DELETE_BTN_QSS = """
+    QPushButton {
+        background-color: #DC3545;
+        color: white;
+        border: none;
+        padding: 10px 20px;
+        border-radius: 4px;
+        font-size: 12px;
+        font-weight: 600;
+        min-width: 100px;
+    }
+    QPushButton:hover {
+        background-color: #C82333;
+    }
+    QPushButton:pressed {
+        background-color: #BD2130;
+    }
+    QPushButton:disabled {
+        background-color: #1E1E1E;
+        color: rgba(255, 255, 255, 0.5);
+        border: 1px solid #2D2D2D;
+    }
+"""
+
+_CLOSE_BTN_QSS = """
+    QPushButton {
+        background-color: #2D2D2D;
+        color: #FFFFFF;
+        border: 1px solid #3F3F3F;
+        padding: 10px 20px;
+        border-radius: 4px;
+        font-size: 12px;
+        font-weight: 600;
+        min-width: 100px;
+    }
+    QPushButton:hover {
+        background-color: #3F3F3F;
+    }
+    QPushButton:pressed {
+        background-color: #0078D7;
+    }
+"""
+
+
 class CameraListWidget(QDialog):
     """
     Dialog for managing camera configurations.
@@ -2246,6 +2943,22 @@ class CameraListWidget(QDialog):
         Buttons for add, edit, delete, and close operations
     """
     
+    # Icon/symbol and text description for each camera state
+    _STATE_ICON = {
+        CameraState.STOPPED: "⏹",  # Stop symbol
+        CameraState.STARTING: "⏳",  # Hourglass
+        CameraState.RUNNING: "▶",  # Play symbol
+        CameraState.PAUSED: "⏸",  # Pause symbol
+        CameraState.ERROR: "⚠",  # Warning symbol
+    }
+    _STATE_TEXT = {
+        CameraState.STOPPED: "Stopped",
+        CameraState.STARTING: "Starting...",
+        CameraState.RUNNING: "Running",
+        CameraState.PAUSED: "Paused",
+        CameraState.ERROR: "Error",
+    }
+    
     def __init__(self, camera_manager: CameraManager, parent=None):
         """
         Initialize the CameraListWidget.
@@ -2258,8 +2971,18 @@ class CameraListWidget(QDialog):
         
         self.camera_manager = camera_manager
         
+        # Map camera IDs to their list items for incremental updates
+        self._items: Dict[str, QListWidgetItem] = {}
+        
+        # Camera form, built on first use and reused afterwards
+        self._camera_config_dialog: Optional[CameraConfigDialog] = None
+        self._form_camera_id: Optional[str] = None
+        
         # Create list widget
         self.camera_list_view = QListWidget(self)
+        # All rows share the same height, so let Qt size them from the first item
+        # instead of querying every item's size hint on layout and scroll
+        self.camera_list_view.setUniformItemSizes(True)
         self.camera_list_view.itemSelectionChanged.connect(self.on_selection_changed)
         
         # Create buttons
@@ -2281,9 +3004,10 @@ class CameraListWidget(QDialog):
         self.init_gui()
         
         # Connect to CameraManager signals
-        self.camera_manager.camera_added.connect(lambda camera_id: self.refresh_list())
-        self.camera_manager.camera_removed.connect(lambda camera_id: self.refresh_list())
-        self.camera_manager.camera_updated.connect(lambda camera_id: self.refresh_list())
+        # Only the affected row is touched on each change
+        self.camera_manager.camera_added.connect(self._add_item)
+        self.camera_manager.camera_removed.connect(self._remove_item)
+        self.camera_manager.camera_updated.connect(self._update_item)
         
         # Initial list population
         self.refresh_list()
@@ -2291,110 +3015,20 @@ class CameraListWidget(QDialog):
     def init_gui(self):
         """Initialize and set up the dialog layout."""
         # Apply dark theme to dialog
-        self.setStyleSheet("""
-            QDialog {
-                background-color: #1E1E1E;
-                color: #FFFFFF;
-            }
-        """)
+        self.setStyleSheet(_LIST_DIALOG_QSS)
         
         # Style the camera list widget with dark theme
-        self.camera_list_view.setStyleSheet("""
-            QListWidget {
-                background-color: #2D2D2D;
-                color: #FFFFFF;
-                border: 1px solid #3F3F3F;
-                border-radius: 4px;
-                padding: 5px;
-                font-size: 13px;
-            }
-            QListWidget::item {
-                padding: 8px;
-                border-bottom: 1px solid #3F3F3F;
-            }
-            QListWidget::item:selected {
-                background-color: rgba(0, 120, 215, 0.3);
-                color: #FFFFFF;
-            }
-            QListWidget::item:hover {
-                background-color: #3F3F3F;
-            }
-        """)
+        self.camera_list_view.setStyleSheet(_CAMERA_LIST_QSS)
         
         # Style buttons consistently with dark theme
-        button_style = """
-            QPushButton {
-                background-color: #2D2D2D;
-                color: #FFFFFF;
-                border: 1px solid #3F3F3F;
-                padding: 10px 20px;
-                border-radius: 4px;
-                font-size: 12px;
-                font-weight: 600;
-                min-width: 100px;
-            }
-            QPushButton:hover {
-                background-color: #3F3F3F;
-                border: 1px solid #0078D7;
-            }
-            QPushButton:pressed {
-                background-color: #0078D7;
-                border: 1px solid #0078D7;
-            }
-            QPushButton:disabled {
-                background-color: #1E1E1E;
-                color: rgba(255, 255, 255, 0.5);
-                border: 1px solid #2D2D2D;
-            }
-        """
-        
-        self.add_button.setStyleSheet(button_style)
-        self.edit_button.setStyleSheet(button_style)
+        self.add_button.setStyleSheet(_BUTTON_QSS)
+        self.edit_button.setStyleSheet(_BUTTON_QSS)
         
         # Delete button gets a different color to indicate destructive action
-        self.delete_button.setStyleSheet("""
-            QPushButton {
-                background-color: #DC3545;
-                color: white;
-                border: none;
-                padding: 10px 20px;
-                border-radius: 4px;
-                font-size: 12px;
-                font-weight: 600;
-                min-width: 100px;
-            }
-            QPushButton:hover {
-                background-color: #C82333;
-            }
-            QPushButton:pressed {
-                background-color: #BD2130;
-            }
-            QPushButton:disabled {
-                background-color: #1E1E1E;
-                color: rgba(255, 255, 255, 0.5);
-                border: 1px solid #2D2D2D;
-            }
-        """)
+        self.delete_button.setStyleSheet(_DELETE_BTN_QSS)
         
         # Close button gets a neutral style with dark theme
-        self.close_button.setStyleSheet("""
-            QPushButton {
-                background-color: #2D2D2D;
-                color: #FFFFFF;
-                border: 1px solid #3F3F3F;
-                padding: 10px 20px;
-                border-radius: 4px;
-                font-size: 12px;
-                font-weight: 600;
-                min-width: 100px;
-            }
-            QPushButton:hover {
-                background-color: #3F3F3F;
-            }
-            QPushButton:pressed {
-                background-color: #0078D7;
-            }
-        """)
+        self.close_button.setStyleSheet(_CLOSE_BTN_QSS)
         
         # Create buttons layout
         buttons_layout = QVBoxLayout()
@@ -2417,35 +3051,100 @@ class CameraListWidget(QDialog):
         # Set window properties
         self.setWindowTitle("Camera Settings")
         self.setMinimumSize(600, 400)
-        
-        # Style the dialog itself
-        self.setStyleSheet("""
-            QDialog {
-                background-color: #F8F9FA;
-            }
-        """)
     
     def refresh_list(self):
-        """Update the displayed camera list."""
+        """
+        Rebuild the displayed camera list from scratch.
+        
+        Used for the initial population; subsequent changes are applied
+        incrementally by _add_item, _remove_item and _update_item.
+        """
         self.camera_list_view.clear()
+        self._items.clear()
         
-        cameras = self.camera_manager.get_all_cameras()
+        for camera in self.camera_manager.get_all_cameras():
+            self._append_camera(camera)
+    
+    def _format_item_text(self, camera: CameraInstance) -> str:
+        """
+        Build the display text for a camera row.
         
-        for camera in cameras:
-            # Create display text with camera name, IP, and state
-            state_icon = self._get_state_icon(camera.state)
-            state_text = self._get_state_text(camera.state)
-            display_text = f"{state_icon}  {camera.name}\n    {camera.ip_address}:{camera.port} - {state_text}"
-            
-            # Create list item
-            item = QListWidgetItem(display_text)
-            item.setData(Qt.UserRole, camera.id)  # Store camera ID
+        Args:
+            camera: CameraInstance to format
             
-            # Set item height for better appearance
-            from PyQt5.QtCore import QSize
-            item.setSizeHint(QSize(0, 50))
+        Returns:
+            Display text with camera name, IP, and state
+        """
+        state_icon = self._get_state_icon(camera.state)
+        state_text = self._get_state_text(camera.state)
+        return f"{state_icon}  {camera.name}\n    {camera.ip_address}:{camera.port} - {state_text}"
+    
+    def _append_camera(self, camera: CameraInstance) -> QListWidgetItem:
+        """
+        Create a list item for a camera and append it to the list.
+        
+        Args:
+            camera: CameraInstance to add
             
-            self.camera_list_view.addItem(item)
+        Returns:
+            The created QListWidgetItem
+        """
+        item = QListWidgetItem(self._format_item_text(camera))
+        item.setData(Qt.UserRole, camera.id)  # Store camera ID
+        
+        # Set item height for better appearance (shared by all rows via uniform item sizes)
+        item.setSizeHint(QSize(0, 50))
+        
+        self.camera_list_view.addItem(item)
+        self._items[camera.id] = item
+        
+        return item
+    
+    def _add_item(self, camera_id: str) -> None:
+        """
+        Handle camera_added signal by appending a single row.
+        
+        Args:
+            camera_id: ID of camera that was added
+        """
+        if camera_id in self._items:
+            self._update_item(camera_id)
+            return
+        
+        camera = self.camera_manager.get_camera(camera_id)
+        if camera:
+            self._append_camera(camera)
+    
+    def _remove_item(self, camera_id: str) -> None:
+        """
+        Handle camera_removed signal by taking a single row out of the list.
+        
+        Args:
+            camera_id: ID of camera that was removed
+        """
+        item = self._items.pop(camera_id, None)
+        if item is None:
+            return
+        
+        row = self.camera_list_view.row(item)
+        if row >= 0:
+            self.camera_list_view.takeItem(row)
+    
+    def _update_item(self, camera_id: str) -> None:
+        """
+        Handle camera_updated signal by refreshing the text of a single row.
+        
+        Args:
+            camera_id: ID of camera that was updated
+        """
+        item = self._items.get(camera_id)
+        if item is None:
+            self._add_item(camera_id)
+            return
+        
+        camera = self.camera_manager.get_camera(camera_id)
+        if camera:
+            item.setText(self._format_item_text(camera))
     
     def _get_state_icon(self, state: CameraState) -> str:
         """
@@ -2457,18 +3156,7 @@ class CameraListWidget(QDialog):
         Returns:
             String icon/symbol representing the state
         """
-        if state == CameraState.STOPPED:
-            return "⏹"  # Stop symbol
-        elif state == CameraState.STARTING:
-            return "⏳"  # Hourglass
-        elif state == CameraState.RUNNING:
-            return "▶"  # Play symbol
-        elif state == CameraState.PAUSED:
-            return "⏸"  # Pause symbol
-        elif state == CameraState.ERROR:
-            return "⚠"  # Warning symbol
-        else:
-            return "○"  # Circle
+        return self._STATE_ICON.get(state, "○")  # Circle for unknown states
     
     def _get_state_text(self, state: CameraState) -> str:
         """
@@ -2480,18 +3168,7 @@ class CameraListWidget(QDialog):
         Returns:
             String description of the state
         """
-        if state == CameraState.STOPPED:
-            return "Stopped"
-        elif state == CameraState.STARTING:
-            return "Starting..."
-        elif state == CameraState.RUNNING:
-            return "Running"
-        elif state == CameraState.PAUSED:
-            return "Paused"
-        elif state == CameraState.ERROR:
-            return "Error"
-        else:
-            return "Unknown"
+        return self._STATE_TEXT.get(state, "Unknown")
     
     def on_selection_changed(self):
         """Handle selection changes in the list."""
@@ -2510,45 +3187,54 @@ class CameraListWidget(QDialog):
         if camera_id:
             camera_instance = self.camera_manager.get_camera(camera_id)
         
-        dialog = CameraConfigDialog(self, camera_instance)
+        if self._camera_config_dialog is None:
+            self._camera_config_dialog = CameraConfigDialog(self)
+            self._camera_config_dialog.accepted.connect(self._apply_camera_data)
         
-        if dialog.exec_() == QDialog.Accepted:
-            camera_data = dialog.get_camera_data()
-            
-            if camera_id:
-                # Edit mode - update existing camera
-                if camera_instance:
-                    camera_instance.name = camera_data["name"]
-                    camera_instance.protocol = camera_data["protocol"]
-                    camera_instance.username = camera_data["username"]
-                    camera_instance.password = camera_data["password"]
-                    camera_instance.ip_address = camera_data["ip_address"]
-                    camera_instance.port = camera_data["port"]
-                    camera_instance.stream_path = camera_data["stream_path"]
-                    camera_instance.resolution = camera_data["resolution"]
-                    
-                    # Attempt to save and notify user if failed
-                    if not self.camera_manager.save_to_settings():
-                        QMessageBox.warning(
-                            self,
-                            "Storage Error",
-                            "Failed to save camera settings to storage. "
-                            "Changes may not persist after application restart."
-                        )
-                    
-                    self.camera_manager.camera_updated.emit(camera_id)
-            else:
-                # Add mode - create new camera
-                camera_id = self.camera_manager.add_camera(camera_data)
-                
-                # Check if save failed (add_camera already logs warning)
-                if camera_id and self.camera_manager.settings.status() != 0:
-                    QMessageBox.warning(
-                        self,
-                        "Storage Error",
-                        "Camera was added but failed to save to storage. "
+        self._form_camera_id = camera_id
+        self._camera_config_dialog.reset(camera_instance)
+        
+        # open() keeps the main event loop (and video) running while the form is up
+        self._camera_config_dialog.open()
+    
+    def _apply_camera_data(self):
+        """Apply the data of the accepted camera form."""
+        camera_data = self._camera_config_dialog.get_camera_data()
+        camera_id = self._form_camera_id
+        
+        if camera_id:
+            # Edit mode - update existing camera
+            camera_instance = self.camera_manager.get_camera(camera_id)
+            if camera_instance and camera_instance.update_from_dict(camera_data):
+                # Attempt to save and notify user if failed
+                if not self.camera_manager.save_to_settings():
+                    self._show_storage_warning(
+                        "Failed to save camera settings to storage. "
                         "Changes may not persist after application restart."
                     )
+                
+                self.camera_manager.camera_updated.emit(camera_id)
+        else:
+            # Add mode - create new camera
+            camera_id = self.camera_manager.add_camera(camera_data)
+            
+            # Check if save failed (add_camera already logs warning)
+            if camera_id and self.camera_manager.settings_status() != 0:
+                self._show_storage_warning(
+                    "Camera was added but failed to save to storage. "
+                    "Changes may not persist after application restart."
+                )
+    
+    def _show_storage_warning(self, message: str):
+        """
+        Show a non-blocking storage error message box.
+        
+        Args:
+            message: Warning text to display
+        """
+        box = QMessageBox(QMessageBox.Warning, "Storage Error", message, QMessageBox.Ok, self)
+        box.setAttribute(Qt.WA_DeleteOnClose)
+        box.open()
     
     def handle_add(self):
         """Handle add button click."""
@@ -2575,19 +3261,78 @@ class CameraListWidget(QDialog):
         if not camera:
             return
         
-        # Confirm deletion
-        reply = QMessageBox.question(
-            self,
+        # Confirm deletion without blocking the main event loop
+        box = QMessageBox(
+            QMessageBox.Question,
             "Confirm Deletion",
             f"Are you sure you want to delete camera '{camera.name}'?",
             QMessageBox.Yes | QMessageBox.No,
-            QMessageBox.No
+            self
         )
+        box.setDefaultButton(QMessageBox.No)
+        box.setAttribute(Qt.WA_DeleteOnClose)
+        box.finished.connect(lambda result: self._confirm_delete(camera_id, result))
+        box.open()
+    
+    def _confirm_delete(self, camera_id: str, result: int):
+        """
+        Delete a camera once the confirmation box has been answered.
         
-        if reply == QMessageBox.Yes:
+        Args:
+            camera_id: ID of the camera to delete
+            result: Standard button chosen in the confirmation box
+        """
+        if result == QMessageBox.Yes:
             self.camera_manager.remove_camera(camera_id)
 
 
+# Stylesheets shared by every TopNavigationBar and its child widgets
+_NAV_BAR_QSS = """
+    QWidget {
+        background-color: #2D2D2D;
+        border-bottom: 1px solid #3F3F3F;
+    }
+"""
+
+_NAV_TITLE_QSS = """
+    QLabel {
+        color: white;
+        font-size: 16px;
+        font-weight: bold;
+        background-color: transparent;
+        border: none;
+    }
+"""
+
+_MENU_BUTTON_QSS = """
+    QPushButton {
+        background-color: transparent;
+        color: white;
+        border: none;
+        padding: 8px 16px;
+        font-size: 13px;
+        font-weight: 500;
+    }
+    QPushButton:hover {
+        background-color: #3F3F3F;
+        border-radius: 4px;
+    }
+    QPushButton:pressed {
+        background-color: #0078D7;
+        border-radius: 4px;
+    }
+"""
+
+_STATUS_INDICATOR_QSS = """
+    QLabel {
+        color: #CCCCCC;
+        font-size: 12px;
+        background-color: transparent;
+        border: none;
+    }
+"""
+
+
 class TopNavigationBar(QWidget):
     """
     Custom QWidget providing the top navigation bar with branding and system controls.
@@ -2622,12 +3367,7 @@ class TopNavigationBar(QWidget):
         self.setFixedHeight(50)
         
         # Apply dark theme styling
-        self.setStyleSheet("""
-            QWidget {
-                background-color: #2D2D2D;
-                border-bottom: 1px solid #3F3F3F;
-            }
-        """)
+        self.setStyleSheet(_NAV_BAR_QSS)
         
         # Initialize attributes
         self.app_logo = None
@@ -2674,26 +3414,29 @@ class TopNavigationBar(QWidget):
             logo_path: Path to logo image file (optional)
             title: Application title text
         """
-        # Add logo if path provided
-        if logo_path and os.path.exists(logo_path):
+        # Add logo if path provided; a single stat both checks the file
+        # exists and gives the modification time for the cache key
+        try:
+            logo_mtime = os.path.getmtime(logo_path) if logo_path else None
+        except OSError:
+            logo_mtime = None
+        
+        if logo_mtime is not None:
             self.app_logo = QLabel(self)
-            pixmap = QPixmap(logo_path)
-            # Scale logo to fit within navigation bar height
-            scaled_pixmap = pixmap.scaled(32, 32, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+            # Reuse the decoded and scaled logo until the file changes
+            key = f"logo:{logo_path}:{logo_mtime}:32"
+            scaled_pixmap = QPixmapCache.find(key)
+            if scaled_pixmap is None:
+                # Scale logo to fit within navigation bar height
+                scaled_pixmap = QPixmap(logo_path).scaled(
+                    32, 32, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+                QPixmapCache.insert(key, scaled_pixmap)
             self.app_logo.setPixmap(scaled_pixmap)
             self.left_layout.addWidget(self.app_logo)
         
         # Add title
         self.app_title = QLabel(title, self)
-        self.app_title.setStyleSheet("""
-            QLabel {
-                color: white;
-                font-size: 16px;
-                font-weight: bold;
-                background-color: transparent;
-                border: none;
-            }
-        """)
+        self.app_title.setStyleSheet(_NAV_TITLE_QSS)
         self.left_layout.addWidget(self.app_title)
     
     def add_menu_button(self, text: str, callback) -> QPushButton:
@@ -2708,27 +3451,10 @@ class TopNavigationBar(QWidget):
             The created QPushButton
         """
         button = QPushButton(text, self)
-        button.setStyleSheet("""
-            QPushButton {
-                background-color: transparent;
-                color: white;
-                border: none;
-                padding: 8px 16px;
-                font-size: 13px;
-                font-weight: 500;
-            }
-            QPushButton:hover {
-                background-color: #3F3F3F;
-                border-radius: 4px;
-            }
-            QPushButton:pressed {
-                background-color: #0078D7;
-                border-radius: 4px;
-            }
-        """)
+        button.setStyleSheet(_MENU_BUTTON_QSS)
         
         # Connect to callback
-        button.clicked.connect(lambda: self._on_menu_clicked(text, callback))
+        button.clicked.connect(partial(self._on_menu_clicked, text, callback))
         
         # Add to layout and track
         self.center_layout.addWidget(button)
@@ -2745,14 +3471,7 @@ class TopNavigationBar(QWidget):
             widget: Widget to display as status indicator
         """
         # Apply secondary text color styling
-        widget.setStyleSheet("""
-            QLabel {
-                color: #CCCCCC;
-                font-size: 12px;
-                background-color: transparent;
-                border: none;
-            }
-        """)
+        widget.setStyleSheet(_STATUS_INDICATOR_QSS)
         
         # Add to layout and track
         self.right_layout.addWidget(widget)
@@ -2787,6 +3506,46 @@ class TopNavigationBar(QWidget):
             callback()
 
 
+# Stylesheet shared by every CameraTreeView instance
+_CAMERA_TREE_QSS = """
+    QTreeWidget {
+        background-color: #252525;
+        color: white;
+        border: none;
+        outline: none;
+        font-size: 13px;
+    }
+    QTreeWidget::item {
+        height: 32px;
+        padding: 4px;
+        border: none;
+    }
+    QTreeWidget::item:hover {
+        background-color: #3F3F3F;
+    }
+    QTreeWidget::item:selected {
+        background-color: rgba(0, 120, 215, 0.3);
+        color: white;
+    }
+    QTreeWidget::item:selected:active {
+        background-color: rgba(0, 120, 215, 0.5);
+    }
+    QTreeWidget::branch {
+        background-color: #252525;
+    }
+    QTreeWidget::branch:has-children:!has-siblings:closed,
+    QTreeWidget::branch:closed:has-children:has-siblings {
+        border-image: none;
+        image: url(none);
+    }
+    QTreeWidget::branch:open:has-children:!has-siblings,
+    QTreeWidget::branch:open:has-children:has-siblings {
+        border-image: none;
+        image: url(none);
+    }
+"""
+
+
 class CameraTreeView(QTreeWidget):
     """
     Custom QTreeWidget displaying cameras organized by location.
@@ -2808,6 +3567,19 @@ class CameraTreeView(QTreeWidget):
     camera_selected = pyqtSignal(str)
     camera_double_clicked = pyqtSignal(str)
     
+    # Item data role holding a location node's name
+    LOCATION_ROLE = Qt.UserRole + 1
+    
+    # Status icon prefix for each camera state
+    # Red indicator for offline (stopped/error), Green for online (running/starting)
+    _STATE_PREFIX = {
+        CameraState.RUNNING: "🟢 ",  # Green circle for running
+        CameraState.STARTING: "🟢 ",  # Green circle for starting (treating as online)
+        CameraState.PAUSED: "🟡 ",  # Yellow circle for paused
+        CameraState.ERROR: "🔴 ",  # Red circle for error (offline)
+        CameraState.STOPPED: "🔴 ",  # Red circle for stopped (offline)
+    }
+    
     def __init__(self, camera_manager: CameraManager, parent=None):
         """
         Initialize the CameraTreeView.
@@ -2829,43 +3601,7 @@ class CameraTreeView(QTreeWidget):
         self.setExpandsOnDoubleClick(False)  # We handle double-click for fullscreen
         
         # Apply dark theme styling
-        self.setStyleSheet("""
-            QTreeWidget {
-                background-color: #252525;
-                color: white;
-                border: none;
-                outline: none;
-                font-size: 13px;
-            }
-            QTreeWidget::item {
-                height: 32px;
-                padding: 4px;
-                border: none;
-            }
-            QTreeWidget::item:hover {
-                background-color: #3F3F3F;
-            }
-            QTreeWidget::item:selected {
-                background-color: rgba(0, 120, 215, 0.3);
-                color: white;
-            }
-            QTreeWidget::item:selected:active {
-                background-color: rgba(0, 120, 215, 0.5);
-            }
-            QTreeWidget::branch {
-                background-color: #252525;
-            }
-            QTreeWidget::branch:has-children:!has-siblings:closed,
-            QTreeWidget::branch:closed:has-children:has-siblings {
-                border-image: none;
-                image: url(none);
-            }
-            QTreeWidget::branch:open:has-children:!has-siblings,
-            QTreeWidget::branch:open:has-children:has-siblings {
-                border-image: none;
-                image: url(none);
-            }
-        """)
+        self.setStyleSheet(_CAMERA_TREE_QSS)
         
         # Connect signals
         self.itemClicked.connect(self._on_item_clicked)
@@ -2885,9 +3621,15 @@ class CameraTreeView(QTreeWidget):
         if location_name in self.location_nodes:
             return self.location_nodes[location_name]
         
-        # Create location node
-        location_item = QTreeWidgetItem(self)
+        # Create location node, keeping locations sorted by name
+        location_item = QTreeWidgetItem()
         location_item.setText(0, f"📁 {location_name}")
+        location_item.setData(0, self.LOCATION_ROLE, location_name)
+        index = 0
+        while (index < self.topLevelItemCount() and
+               self.topLevelItem(index).data(0, self.LOCATION_ROLE) < location_name):
+            index += 1
+        self.insertTopLevelItem(index, location_item)
         location_item.setExpanded(True)
         
         # Style location node distinctly
@@ -2914,8 +3656,8 @@ class CameraTreeView(QTreeWidget):
         # Ensure location exists
         location_item = self.add_location(location)
         
-        # Create camera item
-        camera_item = QTreeWidgetItem(location_item)
+        # Create camera item detached so filling it in emits no model signals
+        camera_item = QTreeWidgetItem()
         
         # Set camera name and icon based on state
         self._update_camera_item_display(camera_item, camera)
@@ -2923,6 +3665,8 @@ class CameraTreeView(QTreeWidget):
         # Store camera ID in item data
         camera_item.setData(0, Qt.UserRole, camera.id)
         
+        location_item.addChild(camera_item)
+        
         # Store in dictionary
         self.camera_items[camera.id] = camera_item
         
@@ -2936,21 +3680,11 @@ class CameraTreeView(QTreeWidget):
             item: QTreeWidgetItem to update
             camera: CameraInstance with current state
         """
-        # Select icon based on camera state
-        # Red indicator for offline (stopped/error), Green for online (running/starting)
-        if camera.state == CameraState.RUNNING:
-            icon = "🟢"  # Green circle for running
-        elif camera.state == CameraState.STARTING:
-            icon = "🟢"  # Green circle for starting (treating as online)
-        elif camera.state == CameraState.PAUSED:
-            icon = "🟡"  # Yellow circle for paused
-        elif camera.state == CameraState.ERROR:
-            icon = "🔴"  # Red circle for error (offline)
-        else:  # STOPPED
-            icon = "🔴"  # Red circle for stopped (offline)
-        
-        # Set text with icon and camera name
-        item.setText(0, f"{icon} {camera.name}")
+        text = self._STATE_PREFIX.get(camera.state, "🔴 ") + camera.name
+        
+        # Skip setText when unchanged to avoid a model signal and repaint
+        if item.text(0) != text:
+            item.setText(0, text)
     
     def get_selected_camera_id(self) -> Optional[str]:
         """
@@ -2987,55 +3721,81 @@ class CameraTreeView(QTreeWidget):
         
         return True
     
-    def refresh_tree(self) -> None:
+    def add_camera(self, camera_id: str) -> None:
         """
-        Rebuild tree from camera manager.
+        Add the item of a newly added camera without synchronizing the whole tree.
         
-        Loads all cameras from the camera manager and groups them by location.
-        Preserves expansion state of location nodes during refresh.
+        Args:
+            camera_id: ID of camera to add
         """
-        # Save expansion state
-        expanded_locations = set()
-        for location_name, location_item in self.location_nodes.items():
-            if location_item.isExpanded():
-                expanded_locations.add(location_name)
-        
-        # Save current selection
-        selected_camera_id = self.get_selected_camera_id()
-        
-        # Clear existing items
-        self.clear()
-        self.location_nodes.clear()
-        self.camera_items.clear()
+        camera = self.camera_manager.get_camera(camera_id)
+        if camera is None or camera_id in self.camera_items:
+            return
+        self.add_camera_to_location(camera, camera.location)
+    
+    def remove_camera(self, camera_id: str) -> None:
+        """
+        Remove the item of a camera, and its location node if left empty.
         
-        # Get all cameras from manager
-        cameras = self.camera_manager.get_all_cameras()
+        Args:
+            camera_id: ID of camera to remove
+        """
+        item = self.camera_items.pop(camera_id, None)
+        if item is None:
+            return
+        location_item = item.parent()
+        location_item.removeChild(item)
+        if location_item.childCount() == 0:
+            self.takeTopLevelItem(self.indexOfTopLevelItem(location_item))
+            del self.location_nodes[location_item.data(0, self.LOCATION_ROLE)]
+    
+    def refresh_tree(self) -> None:
+        """
+        Synchronize tree with camera manager.
         
-        # Group cameras by location
-        cameras_by_location = {}
-        for camera in cameras:
-            # Get location from camera (default to "Default" if not set)
-            location = getattr(camera, 'location', 'Default')
-            if not location:
-                location = 'Default'
+        Adds, moves, updates and removes camera items in place so unchanged
+        items, their selection and the expansion state of location nodes are
+        kept. Location nodes left without cameras are removed.
+        """
+        # Apply all changes with a single repaint at the end
+        self.setUpdatesEnabled(False)
+        self.blockSignals(True)
+        try:
+            # Get all cameras from manager, keyed by ID with their location
+            # (CameraInstance already normalizes an empty location to "Default")
+            cameras = {
+                camera.id: (camera, camera.location)
+                for camera in self.camera_manager.get_all_cameras()
+            }
             
-            if location not in cameras_by_location:
-                cameras_by_location[location] = []
-            cameras_by_location[location].append(camera)
-        
-        # Add cameras to tree grouped by location
-        for location, location_cameras in sorted(cameras_by_location.items()):
-            for camera in location_cameras:
-                self.add_camera_to_location(camera, location)
-        
-        # Restore expansion state
-        for location_name, location_item in self.location_nodes.items():
-            if location_name in expanded_locations:
-                location_item.setExpanded(True)
-        
-        # Restore selection
-        if selected_camera_id:
-            self.select_camera(selected_camera_id)
+            # Remove items of cameras no longer in the manager
+            for camera_id in set(self.camera_items) - set(cameras):
+                item = self.camera_items.pop(camera_id)
+                item.parent().removeChild(item)
+            
+            for camera_id, (camera, location) in cameras.items():
+                item = self.camera_items.get(camera_id)
+                
+                if item is None:
+                    self.add_camera_to_location(camera, location)
+                elif item.parent().data(0, self.LOCATION_ROLE) != location:
+                    # Location changed - move the item to its new node
+                    selected = item.isSelected()
+                    item.parent().removeChild(item)
+                    del self.camera_items[camera_id]
+                    item = self.add_camera_to_location(camera, location)
+                    item.setSelected(selected)
+                else:
+                    self._update_camera_item_display(item, camera)
+            
+            # Drop location nodes without cameras
+            for location_name, location_item in list(self.location_nodes.items()):
+                if location_item.childCount() == 0:
+                    self.takeTopLevelItem(self.indexOfTopLevelItem(location_item))
+                    del self.location_nodes[location_name]
+        finally:
+            self.blockSignals(False)
+            self.setUpdatesEnabled(True)
     
     def _on_item_clicked(self, item: QTreeWidgetItem, column: int) -> None:
         """
@@ -3083,6 +3843,32 @@ class CameraTreeView(QTreeWidget):
         self._update_camera_item_display(item, camera)
 
 
+# Stylesheets shared by every LeftSidebar instance
+_SIDEBAR_QSS = """
+    QWidget {
+        background-color: #252525;
+        border-right: 1px solid #3F3F3F;
+    }
+"""
+
+_COLLAPSE_BTN_QSS = """
+    QPushButton {
+        background-color: #2D2D2D;
+        color: white;
+        border: none;
+        border-bottom: 1px solid #3F3F3F;
+        font-size: 14px;
+        font-weight: bold;
+    }
+    QPushButton:hover {
+        background-color: #3F3F3F;
+    }
+    QPushButton:pressed {
+        background-color: #0078D7;
+    }
+"""
+
+
 class LeftSidebar(QWidget):
     """
     Custom QWidget providing the left sidebar with camera tree navigation.
@@ -3124,12 +3910,7 @@ class LeftSidebar(QWidget):
         self.setFixedWidth(self.expanded_width)
         
         # Apply dark theme styling with right border
-        self.setStyleSheet("""
-            QWidget {
-                background-color: #252525;
-                border-right: 1px solid #3F3F3F;
-            }
-        """)
+        self.setStyleSheet(_SIDEBAR_QSS)
         
         # Create main vertical layout
         self.main_layout = QVBoxLayout(self)
@@ -3139,22 +3920,7 @@ class LeftSidebar(QWidget):
         # Create collapse button
         self.collapse_button = QPushButton("◀", self)
         self.collapse_button.setFixedHeight(40)
-        self.collapse_button.setStyleSheet("""
-            QPushButton {
-                background-color: #2D2D2D;
-                color: white;
-                border: none;
-                border-bottom: 1px solid #3F3F3F;
-                font-size: 14px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background-color: #3F3F3F;
-            }
-            QPushButton:pressed {
-                background-color: #0078D7;
-            }
-        """)
+        self.collapse_button.setStyleSheet(_COLLAPSE_BTN_QSS)
         self.collapse_button.clicked.connect(self.toggle_collapse)
         
         # Add collapse button to layout
@@ -3239,6 +4005,208 @@ class LeftSidebar(QWidget):
                 self.camera_tree_view.hide()
 
 
+# Dark theme stylesheet applied to the main window and all its children
+_DARK_THEME_QSS = """
+    /* Global application styling */
+    QMainWindow {
+        background-color: #1E1E1E;
+        color: #FFFFFF;
+    }
+
+    QWidget {
+        background-color: #1E1E1E;
+        color: #FFFFFF;
+    }
+
+    /* Button styling */
+    QPushButton {
+        background-color: #2D2D2D;
+        color: #FFFFFF;
+        border: 1px solid #3F3F3F;
+        padding: 8px 16px;
+        border-radius: 4px;
+        font-size: 13px;
+        font-weight: 500;
+    }
+
+    QPushButton:hover {
+        background-color: #3F3F3F;
+        border: 1px solid #0078D7;
+    }
+
+    QPushButton:pressed {
+        background-color: #0078D7;
+        border: 1px solid #0078D7;
+    }
+
+    QPushButton:disabled {
+        background-color: #1E1E1E;
+        color: rgba(255, 255, 255, 0.5);
+        border: 1px solid #2D2D2D;
+    }
+
+    /* Label styling */
+    QLabel {
+        background-color: transparent;
+        color: #FFFFFF;
+    }
+
+    /* Line edit styling */
+    QLineEdit {
+        background-color: #2D2D2D;
+        color: #FFFFFF;
+        border: 1px solid #3F3F3F;
+        padding: 6px;
+        border-radius: 4px;
+        selection-background-color: #0078D7;
+    }
+
+    QLineEdit:focus {
+        border: 1px solid #0078D7;
+    }
+
+    /* Combo box styling */
+    QComboBox {
+        background-color: #2D2D2D;
+        color: #FFFFFF;
+        border: 1px solid #3F3F3F;
+        padding: 6px;
+        border-radius: 4px;
+    }
+
+    QComboBox:hover {
+        border: 1px solid #0078D7;
+    }
+
+    QComboBox::drop-down {
+        border: none;
+        background-color: #3F3F3F;
+        width: 20px;
+    }
+
+    QComboBox::down-arrow {
+        image: none;
+        border-left: 4px solid transparent;
+        border-right: 4px solid transparent;
+        border-top: 6px solid #FFFFFF;
+        margin-right: 6px;
+    }
+
+    QComboBox QAbstractItemView {
+        background-color: #2D2D2D;
+        color: #FFFFFF;
+        border: 1px solid #3F3F3F;
+        selection-background-color: #0078D7;
+    }
+
+    /* List widget styling */
+    QListWidget {
+        background-color: #2D2D2D;
+        color: #FFFFFF;
+        border: 1px solid #3F3F3F;
+        border-radius: 4px;
+    }
+
+    QListWidget::item {
+        padding: 8px;
+        border-bottom: 1px solid #3F3F3F;
+    }
+
+    QListWidget::item:selected {
+        background-color: rgba(0, 120, 215, 0.3);
+        color: #FFFFFF;
+    }
+
+    QListWidget::item:hover {
+        background-color: #3F3F3F;
+    }
+
+    /* Tree widget styling */
+    QTreeWidget {
+        background-color: #252525;
+        color: #FFFFFF;
+        border: none;
+        outline: none;
+    }
+
+    QTreeWidget::item {
+        padding: 6px;
+        border: none;
+    }
+
+    QTreeWidget::item:selected {
+        background-color: rgba(0, 120, 215, 0.3);
+        color: #FFFFFF;
+    }
+
+    QTreeWidget::item:hover {
+        background-color: #3F3F3F;
+    }
+
+    QTreeWidget::branch {
+        background-color: #252525;
+    }
+
+    /* Dialog styling */
+    QDialog {
+        background-color: #1E1E1E;
+        color: #FFFFFF;
+    }
+
+    /* Status bar styling */
+    QStatusBar {
+        background-color: #2D2D2D;
+        color: #CCCCCC;
+        border-top: 1px solid #3F3F3F;
+    }
+
+    QStatusBar QLabel {
+        color: #CCCCCC;
+    }
+
+    /* Scroll bar styling */
+    QScrollBar:vertical {
+        background-color: #1E1E1E;
+        width: 12px;
+        border: none;
+    }
+
+    QScrollBar::handle:vertical {
+        background-color: #3F3F3F;
+        border-radius: 6px;
+        min-height: 20px;
+    }
+
+    QScrollBar::handle:vertical:hover {
+        background-color: #0078D7;
+    }
+
+    QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {
+        height: 0px;
+    }
+
+    QScrollBar:horizontal {
+        background-color: #1E1E1E;
+        height: 12px;
+        border: none;
+    }
+
+    QScrollBar::handle:horizontal {
+        background-color: #3F3F3F;
+        border-radius: 6px;
+        min-width: 20px;
+    }
+
+    QScrollBar::handle:horizontal:hover {
+        background-color: #0078D7;
+    }
+
+    QScrollBar::add-line:horizontal, QScrollBar::sub-line:horizontal {
+        width: 0px;
+    }
+"""
+
+
 class Windows(QMainWindow):
     """
     Main application window class.
@@ -3248,13 +4216,25 @@ class Windows(QMainWindow):
 
     Attributes:
         app_settings (QSettings): Application settings manager
-        mutex (QMutex): Mutex for thread synchronization
+        frame_lock (threading.Lock): Lock guarding access to the shared frame
         video_label (QLabel): Label for displaying video stream
         current_frame (np.ndarray): Current video frame
-        zoom_factor (float): Current zoom level
+        zoom_level (int): Current zoom level in wheel steps
+        zoom_factor (float): Current zoom factor
         is_full_screen (bool): Fullscreen state flag
     """
 
+    # Enabled state of the (start, stop, pause, snapshot) buttons for the
+    # state of the selected camera; None means no camera is selected
+    _BUTTON_STATES = {
+        None: (False, False, False, False),
+        CameraState.STOPPED: (True, False, False, False),
+        CameraState.STARTING: (False, True, False, False),
+        CameraState.RUNNING: (False, True, True, True),
+        CameraState.PAUSED: (False, True, True, True),
+        CameraState.ERROR: (True, False, False, False),
+    }
+
     def __init__(self) -> None:
         """Initialize the main window and set up the user interface."""
         super(Windows, self).__init__()
@@ -3265,8 +4245,8 @@ class Windows(QMainWindow):
         # Migrate old settings to new multi-camera format if needed
         migrate_settings(self.app_settings)
 
-        # Create a mutex to access the shared resource (frame)
-        self.mutex = QMutex()
+        # Create a lock to access the shared resource (frame)
+        self.frame_lock = threading.Lock()
 
         # Create a label in the status bar to show status messages.
         self.status_bar_message_label = QLabel()
@@ -3280,6 +4260,11 @@ class Windows(QMainWindow):
         # Create CameraManager instance for multi-camera support
         self.camera_manager = CameraManager(self.app_settings)
         
+        # Write camera settings from a background thread so saving never
+        # blocks the GUI; pending writes are flushed in closeEvent
+        self.settings_writer = SettingsWriter(self.app_settings)
+        self.camera_manager.set_settings_writer(self.settings_writer)
+        
         # Create camera grid container widget (no parent initially, will be added to layout)
         self.camera_grid_container = QWidget()
         self.camera_grid_container.setStyleSheet("background-color: black;")
@@ -3290,30 +4275,43 @@ class Windows(QMainWindow):
         
         # Initialize camera_panels dictionary to track panel widgets
         self.camera_panels: Dict[str, CameraPanel] = {}
-        
-        # Keep old video_label for backward compatibility (will be hidden when using multi-camera)
-        self.video_label = QLabel()
-        self.video_label.setContentsMargins(0, 0, 0, 0)
-        self.video_label.setAlignment(Qt.AlignCenter)
-        self.video_label.setStyleSheet("background-color: black;")
-        self.video_label.hide()  # Hide by default, show only if no cameras configured
+        # Layout item of each panel, so panels are found without scanning the layout
+        self._panel_layout_items: Dict[str, QWidgetItem] = {}
+        
+        # Latest undisplayed frame per camera; frames replaced before the next
+        # render are dropped so display latency cannot build up
+        self._latest_frames: Dict[str, np.ndarray] = {}
+        self._frame_render_timer = QTimer(self)
+        self._frame_render_timer.setSingleShot(True)
+        self._frame_render_timer.timeout.connect(self._render_latest_frames)
+        
+        # Status bar updates arriving within 250 ms of the last one shown are
+        # merged, so the status bar is relaid out at most 4 times per second
+        self._pending_status: Dict[str, str] = {}
+        self._status_timer = QTimer(self)
+        self._status_timer.setSingleShot(True)
+        self._status_timer.setInterval(250)
+        self._status_timer.timeout.connect(self._flush_status)
+        
+        # Old single-camera video_label, kept for backward compatibility and
+        # only built when the legacy code paths first use it
+        self._video_label: Optional[QLabel] = None
+        # Solid fill pixmaps for the video label, keyed by colour: (size, pixmap)
+        self._solid_pixmaps: Dict[int, Tuple[QSize, QPixmap]] = {}
 
         # Control buttons will be created in init_gui() and added to top navigation bar
 
-        # Read camera persisted settings if existed.
-        self.protocol: str = self.app_settings.value('protocol', 'rtsp', type=str)
-        self.user: str = self.app_settings.value('user', '', type=str)
-        self.password: str = self.app_settings.value('password', '', type=str)
-        self.ip: str = self.app_settings.value('ip', '', type=str)
-        self.port: int = self.app_settings.value('port', 554, type=int)  # Default RTSP port
-        self.stream_path: str = self.app_settings.value('stream_path', '', type=str)
-        # Retrieve the tuple as a string
-        video_resolution_str = self.app_settings.value('video_resolution', '', type=str)
-        # Convert the string back to a tuple using eval
-        if video_resolution_str:
-            self.video_resolution: Tuple[int, int] = eval(video_resolution_str)
-        else:
-            self.video_resolution: Tuple[int, int] = (1920, 1080)
+        # Read camera persisted settings if existed (all keys in one pass).
+        stored_settings = self._load_all_settings()
+        self.protocol: str = str(stored_settings.get('protocol', 'rtsp'))
+        self.user: str = str(stored_settings.get('user', ''))
+        self.password: str = str(stored_settings.get('password', ''))
+        self.ip: str = str(stored_settings.get('ip', ''))
+        self.port: int = int(stored_settings.get('port', 554))  # Default RTSP port
+        self.stream_path: str = str(stored_settings.get('stream_path', ''))
+        # Resolution is stored as two integers (legacy strings are converted by migrate_settings)
+        self.video_resolution: Tuple[int, int] = (int(stored_settings.get('res_w', 1920)),
+                                                  int(stored_settings.get('res_h', 1080)))
 
         # Variable for pausing
         self.is_running = False
@@ -3321,7 +4319,8 @@ class Windows(QMainWindow):
         # Store the current frame for snapshot functionality
         self.current_frame = None
 
-        # Store the zoom factor. Start with no zoom
+        # Store the zoom level and factor. Start with no zoom
+        self.zoom_level = 0
         self.zoom_factor = 1.0
 
         # Variables for panning
@@ -3363,18 +4362,46 @@ class Windows(QMainWindow):
             else:
                 self.update_status_bar('Ready', "Select a camera to control", "")
 
-        # Create the loading animation (legacy)
-        self.loading_animation = LoadingAnimation(self,
-                                                  "/images/Spinner-1s-104px.gif",
-                                                  (104, 104))
-
-        # Create an instance of the RTSPCameraStream class (legacy - for backward compatibility)
-        self.rtspCameraStream = StreamThread(self.url, self.video_resolution, "")
-        self.rtspCameraStream.first_frame_received.connect(lambda camera_id: self.setup_widgets_when_playing())
-        self.rtspCameraStream.frame_received.connect(lambda camera_id, frame: self.display_frame(frame))
-        self.rtspCameraStream.finished.connect(self.setup_widgets_when_stopped)
-        self.rtspCameraStream.error_signal.connect(lambda camera_id, error: self.error_streaming(error))
-        self.rtspCameraStream.status_signal.connect(lambda camera_id, status: self.streaming_status(status))
+        # The legacy loading animation and RTSPCameraStream are only created
+        # when the legacy single-camera code first uses them
+        self._loading_animation: Optional[LoadingAnimation] = None
+        self._rtsp_camera_stream: Optional[StreamThread] = None
+
+    @property
+    def loading_animation(self) -> LoadingAnimation:
+        """Legacy loading animation, created on first use."""
+        if self._loading_animation is None:
+            self._loading_animation = LoadingAnimation(self,
+                                                       "/images/Spinner-1s-104px.gif",
+                                                       (104, 104))
+        return self._loading_animation
+
+    @property
+    def rtspCameraStream(self) -> StreamThread:
+        """Legacy single-camera stream thread, created on first use."""
+        if self._rtsp_camera_stream is None:
+            # Create an instance of the RTSPCameraStream class (legacy - for backward compatibility)
+            self._rtsp_camera_stream = StreamThread(self.url, self.video_resolution, "")
+            self._rtsp_camera_stream.first_frame_received.connect(lambda camera_id: self.setup_widgets_when_playing())
+            self._rtsp_camera_stream.frame_received.connect(lambda camera_id, frame: self.display_frame(frame))
+            self._rtsp_camera_stream.finished.connect(self.setup_widgets_when_stopped)
+            self._rtsp_camera_stream.error_signal.connect(lambda camera_id, error: self.error_streaming(error))
+            self._rtsp_camera_stream.status_signal.connect(lambda camera_id, status: self.streaming_status(status))
+        return self._rtsp_camera_stream
+
+    def _load_all_settings(self) -> Dict[str, object]:
+        """
+        Read all persisted application settings into a dictionary.
+        
+        Syncs the settings store once and sweeps every key, so the legacy
+        per-key lookups become dictionary reads instead of separate trips
+        into the platform settings backend.
+        
+        Returns:
+            Dictionary mapping setting keys to their stored values
+        """
+        self.app_settings.sync()
+        return {key: self.app_settings.value(key) for key in self.app_settings.allKeys()}
 
     def init_gui(self) -> None:
         """Initialize and set up the graphical user interface."""
@@ -3392,14 +4419,10 @@ class Windows(QMainWindow):
         self.top_nav_bar = TopNavigationBar()
         
         # Set up branding with application name
-        logo_path = os.path.dirname(os.path.realpath(__file__)) + "/images/Security-Camera-icon.png"
-        if os.path.exists(logo_path):
-            self.top_nav_bar.set_branding(logo_path, "IP Camera Player")
-        else:
-            self.top_nav_bar.set_branding(None, "IP Camera Player")
+        self.top_nav_bar.set_branding(_LOGO_PATH if _LOGO_EXISTS else None, "IP Camera Player")
         
         # Add Settings button
-        self.top_nav_bar.add_menu_button("Settings", self.open_camera_settings)
+        settings_button = self.top_nav_bar.add_menu_button("Settings", self.open_camera_settings)
         
         # Add control buttons to top navigation bar and store references
         self.start_button = self.top_nav_bar.add_menu_button("Start", self.start_streaming)
@@ -3407,6 +4430,10 @@ class Windows(QMainWindow):
         self.take_snapshot_button = self.top_nav_bar.add_menu_button("Snapshot", self.take_snapshot)
         self.stop_button = self.top_nav_bar.add_menu_button("Stop", self.stop_streaming)
         
+        # Buttons toggled together by enable_widgets
+        self._toggleable_widgets = (settings_button, self.start_button, self.pause_button,
+                                    self.take_snapshot_button, self.stop_button)
+        
         # Set initial button states
         self.start_button.setEnabled(False)
         self.pause_button.setEnabled(False)
@@ -3459,14 +4486,14 @@ class Windows(QMainWindow):
         # Set window properties
         self.setMinimumSize(720, 720)  # self.setMinimumSize(1280, 720)
         self.setWindowTitle("IP Camera Player")
-        file_name = os.path.dirname(os.path.realpath(__file__)) + "\\images\\Security-Camera-icon.png"
-        if path.exists(file_name):
-            self.setWindowIcon(QIcon(file_name))
+        if _LOGO_EXISTS:
+            self.setWindowIcon(_app_icon())
         self.setStatusBar(self.create_status_bar())
         
         # Connect CameraManager signals to UI updates
         self.camera_manager.camera_added.connect(self._on_camera_added)
         self.camera_manager.camera_removed.connect(self._on_camera_removed)
+        self.camera_manager.camera_updated.connect(self._on_camera_updated)
         self.camera_manager.cameras_reordered.connect(self._on_cameras_reordered)
         self.camera_manager.selection_changed.connect(self._on_selection_changed)
         
@@ -3519,32 +4546,55 @@ class Windows(QMainWindow):
     def update_status_bar(self, message: str, url: str, res: str) -> None:
         """
         Update the status bar with new information for multi-camera context.
+        
+        The update is shown right away unless another one was shown less
+        than 250 ms ago; it is then merged into the next scheduled update.
+        Empty values leave the corresponding label unchanged.
 
         Args:
             message: Status message to display
             url: Camera URL to display
             res: Resolution information to display
         """
-        # Get camera count for multi-camera context
-        camera_count = len(self.camera_manager.get_all_cameras())
+        if message:
+            self._pending_status['message'] = message
+        if url:
+            self._pending_status['url'] = url
+        if res:
+            self._pending_status['res'] = res
+        
+        if not self._status_timer.isActive():
+            self._flush_status()
+
+    def _flush_status(self) -> None:
+        """Show the pending status bar values and hold off further updates."""
+        if not self._pending_status:
+            return
+        pending, self._pending_status = self._pending_status, {}
         
         # Update message with camera count context
+        message = pending.get('message')
         if message:
+            camera_count = len(self.camera_manager.get_all_cameras())
             if camera_count > 0:
                 self.status_bar_message_label.setText(f'Status: {message} | Cameras: {camera_count}')
             else:
                 self.status_bar_message_label.setText(f'Status: {message}')
         
+        url = pending.get('url')
         if url:
             self.status_bar_url.setText(f'URL: {url}')
         
+        res = pending.get('res')
         if res:
             self.status_bar_resolution.setText(f'Resolution: {res}')
+        
+        self._status_timer.start()
 
     @staticmethod
     def replace_letters_with_asterisks(input_string: str) -> str:
-        # Replace each letter with '*', keeping non-letters intact
-        return ''.join('*' for char in input_string)
+        # Mask every character of the string with '*'
+        return '*' * len(input_string)
 
     def start_streaming(self) -> None:
         """Start streaming for the selected camera only."""
@@ -3578,19 +4628,7 @@ class Windows(QMainWindow):
         
         # Connect stream signals if not already connected
         if selected_camera.stream_thread:
-            try:
-                selected_camera.stream_thread.frame_received.connect(
-                    lambda camera_id, frame: self._on_frame_received(camera_id, frame)
-                )
-                selected_camera.stream_thread.error_signal.connect(
-                    lambda camera_id, error: self._on_camera_error(camera_id, error)
-                )
-                selected_camera.stream_thread.first_frame_received.connect(
-                    lambda camera_id: self._on_first_frame(camera_id)
-                )
-            except TypeError:
-                # Signals may already be connected
-                pass
+            self._connect_stream_signals(selected_camera.stream_thread)
         
         # Update control buttons
         self.update_control_buttons()
@@ -3598,35 +4636,46 @@ class Windows(QMainWindow):
     def display_frame(self, frame: np.ndarray) -> None:
         if self.rtspCameraStream:
             # Store the frame for snapshot and zoom functionality
+            # (this also keeps the buffer wrapped by the QImage below alive)
             self.current_frame = frame
-            # Convert the frame to RGB format.
-            frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-            # Extract the height, width, and the number of channels.
-            h, w, ch = frame.shape
-            # Calculate bytes per line
-            bytes_per_line = ch * w
-            # Create an image in Qt format using the given frame.
-            q_image = QImage(frame.data, w, h, bytes_per_line, QImage.Format_RGB888)
-            # Create a pixmap from image.
-            pixmap = QPixmap.fromImage(q_image)
-
-            # Apply zoom factor to the pixmap, converting dimensions to integers
+            
+            # Only render when the frame can actually be seen
+            if not self.video_label.isVisible() or self.isMinimized():
+                return
+            # Extract the height and the width.
+            h, w = frame.shape[:2]
+
+            # Apply zoom factor, converting dimensions to integers
             self.scaled_width = int(self.zoom_factor * w)
             self.scaled_height = int(self.zoom_factor * h)
 
-            # Scale the pixmap with integer dimensions and keep the aspect ratio
-            scaled_pixmap = pixmap.scaled(self.scaled_width, self.scaled_height, Qt.KeepAspectRatio)
+            label_width = self.video_label.width()
+            label_height = self.video_label.height()
 
             # Enforce boundary limits for panning (do not pan outside the image)
-            self.x_offset = max(0, min(self.x_offset, self.scaled_width - self.video_label.width()))
-            self.y_offset = max(0, min(self.y_offset, self.scaled_height - self.video_label.height()))
+            self.x_offset = max(0, min(self.x_offset, self.scaled_width - label_width))
+            self.y_offset = max(0, min(self.y_offset, self.scaled_height - label_height))
+
+            # Map the visible area of the zoomed image back to frame coordinates,
+            # so only that region is converted and scaled
+            x0 = int(self.x_offset / self.zoom_factor)
+            y0 = int(self.y_offset / self.zoom_factor)
+            x1 = min(w, math.ceil((self.x_offset + label_width) / self.zoom_factor))
+            y1 = min(h, math.ceil((self.y_offset + label_height) / self.zoom_factor))
+            if x1 <= x0 or y1 <= y0:
+                return
 
-            # Create a sub-area based on panning
-            visible_pixmap = scaled_pixmap.copy(self.x_offset, self.y_offset, self.video_label.width(),
-                                                self.video_label.height())
+            # Wrap the BGR region in place; no color conversion or copy needed
+            pixmap = QPixmap.fromImage(frame_to_qimage(frame[y0:y1, x0:x1]))
+
+            # Scale the visible region only when zoomed
+            if self.zoom_factor != 1.0:
+                pixmap = pixmap.scaled(min(label_width, self.scaled_width - self.x_offset),
+                                       min(label_height, self.scaled_height - self.y_offset),
+                                       Qt.IgnoreAspectRatio)
 
             # Display the frame
-            self.video_label.setPixmap(visible_pixmap)
+            self.video_label.setPixmap(pixmap)
 
     def stop_streaming(self) -> None:
         """Stop streaming for the selected camera only."""
@@ -3689,6 +4738,38 @@ class Windows(QMainWindow):
         self.update_status_bar(status, "", "")
         print(status)
 
+    @property
+    def video_label(self) -> QLabel:
+        """Legacy single-camera video label, created on first use."""
+        if self._video_label is None:
+            self._video_label = QLabel()
+            self._video_label.setContentsMargins(0, 0, 0, 0)
+            self._video_label.setAlignment(Qt.AlignCenter)
+            self._video_label.setStyleSheet("background-color: black;")
+            self._video_label.hide()  # Hidden, the camera grid is used instead
+        return self._video_label
+
+    def _solid_pixmap(self, color: Qt.GlobalColor) -> QPixmap:
+        """
+        Return a pixmap the size of the video label filled with a solid colour.
+        
+        The pixmap is cached per colour and only rebuilt when the label size changes.
+        
+        Args:
+            color: Fill colour of the pixmap
+            
+        Returns:
+            QPixmap: Solid pixmap matching the current video label size
+        """
+        size = self.video_label.size()
+        cached = self._solid_pixmaps.get(color)
+        if cached is not None and cached[0] == size:
+            return cached[1]
+        pixmap = QPixmap(size)
+        pixmap.fill(color)
+        self._solid_pixmaps[color] = (size, pixmap)
+        return pixmap
+
     def reset_video_label(self: 'Windows') -> None:
         """
         Reset the video label to a solid black background after clearing the video frame.
@@ -3696,15 +4777,11 @@ class Windows(QMainWindow):
         # Clear any existing pixmap
         self.video_label.clear()
 
-        # Create a black QPixmap with the same size as the video label
-        black_pixmap = QPixmap(self.video_label.size())
-        black_pixmap.fill(Qt.black)
+        # Set a black pixmap with the same size as the video label
+        self.video_label.setPixmap(self._solid_pixmap(Qt.black))
 
-        # Set the black pixmap as the label's content
-        self.video_label.setPixmap(black_pixmap)
-
-        # Ensure the UI is updated immediately
-        self.video_label.repaint()
+        # Schedule a repaint instead of painting synchronously
+        self.video_label.update()
 
     def set_video_label_to_gray(self: 'Windows') -> None:
         """
@@ -3713,37 +4790,27 @@ class Windows(QMainWindow):
         # Clear any existing pixmap
         self.video_label.clear()
 
-        # Create a black QPixmap with the same size as the video label
-        black_pixmap = QPixmap(self.video_label.size())
-        black_pixmap.fill(Qt.lightGray)
-
-        # Set the black pixmap as the label's content
-        self.video_label.setPixmap(black_pixmap)
+        # Set a gray pixmap with the same size as the video label
+        self.video_label.setPixmap(self._solid_pixmap(Qt.lightGray))
 
-        # Ensure the UI is updated immediately
-        self.video_label.repaint()
+        # Schedule a repaint instead of painting synchronously
+        self.video_label.update()
 
     def enable_widgets(self, enable: bool) -> None:
         """
-        Enable or disable all child widgets of a QMainWindow.
+        Enable or disable the navigation bar buttons of the main window.
 
-        This function iterates through all child widgets of the specified QMainWindow
-        and sets their enabled state according to the 'enabled' parameter.
+        Only the Settings and control buttons are toggled; they repaint
+        themselves when their enabled state changes.
 
         Parameters:
-        - enabled: bool. The state to set for the child widgets (True to enable, False to disable).
+        - enabled: bool. The state to set for the buttons (True to enable, False to disable).
 
         Returns:
         None
         """
-        for widget in self.findChildren(QWidget):
-            if isinstance(widget, QWidget):  # Ensure it's a QWidget
-                if enable:
-                    widget.setEnabled(True)
-                else:
-                    widget.setEnabled(False)
-        # Ensure the UI is updated immediately
-        self.video_label.repaint()
+        for widget in self._toggleable_widgets:
+            widget.setEnabled(enable)
 
     def setup_widgets_when_starting(self) -> None:
         # self.enable_widgets(False)  # disable all the widgets
@@ -3760,7 +4827,8 @@ class Windows(QMainWindow):
 
     def setup_widgets_when_playing(self) -> None:
         # self.enable_widgets(True)
-        self.loading_animation.stop()  # hide the loading animation
+        if self._loading_animation is not None:
+            self._loading_animation.stop()  # hide the loading animation
         self.open_cam_settings_button.setEnabled(False)
         self.start_button.setEnabled(False)
         self.pause_button.setEnabled(True)
@@ -3772,7 +4840,8 @@ class Windows(QMainWindow):
 
     def setup_widgets_when_stopped(self) -> None:
         # self.enable_widgets(True)
-        self.loading_animation.stop()  # stop the loading animation
+        if self._loading_animation is not None:
+            self._loading_animation.stop()  # stop the loading animation
         self.reset_video_label()
         self.open_cam_settings_button.setEnabled(True)
         self.start_button.setEnabled(True)
@@ -3790,12 +4859,9 @@ class Windows(QMainWindow):
         The user will input a custom file name, and the code will concatenate the current date and time.
         """
 
-        # QMutexLocker automatically locks and unlocks the mutex
-        # to access the shared resource (self.current_frame)
-        # locker = QMutexLocker(self.mutex)
-        QMutexLocker(self.mutex)
-
-        try:
+        # The lock is held for the whole block to access the shared
+        # resource (self.current_frame)
+        with self.frame_lock:
             if self.current_frame is not None:
                 # Get the current date and time in the format MM/DD/YYYY and 12-hour time with AM/PM
                 current_time = datetime.now().strftime("%m-%d-%Y_%I-%M-%S%p")
@@ -3824,10 +4890,6 @@ class Windows(QMainWindow):
             else:
                 print("No frame available for snapshot")
 
-        finally:
-            # No need to manually unlock the mutex as QMutexLocker will do this automatically
-            pass
-
     def take_snapshot(self) -> None:
         """
         Take a snapshot of the selected camera's current visible frame
@@ -3844,7 +4906,7 @@ class Windows(QMainWindow):
         panel = self.camera_panels[selected_camera.id]
         
         try:
-            with QMutexLocker(self.mutex):
+            with self.frame_lock:
                 # Get the pixmap from the selected camera's panel
                 pixmap = panel.video_label.pixmap()
         finally:
@@ -3852,8 +4914,9 @@ class Windows(QMainWindow):
 
         if pixmap is not None and not pixmap.isNull():
             try:
-                # Get the currently visible pixmap (with zoom and panning applied)
-                visible_pixmap = pixmap.copy()
+                # Get the currently visible image (with zoom and panning applied)
+                # as a QImage, which the save task can use outside the GUI thread
+                visible_image = pixmap.toImage()
 
                 # Get the current date and time in the format MM/DD/YYYY and 12-hour time with AM/PM
                 current_time = datetime.now().strftime("%m-%d-%Y_%I-%M-%S%p")
@@ -3877,12 +4940,10 @@ class Windows(QMainWindow):
                     final_file_name = f"{base_name}_{current_time}.png"
                     final_path = os.path.join(save_dir, final_file_name)
 
-                    # Save the visible pixmap to the selected file path
-                    if visible_pixmap.save(final_path, 'PNG'):
-                        print(f"Snapshot saved to {final_path}")
-                        self.update_status_bar(f"Snapshot saved: {selected_camera.name}", "", "")
-                    else:
-                        print("Failed to save snapshot.")
+                    # Encode and save the visible image without blocking the video
+                    task = SnapshotSaveTask(visible_image, final_path, selected_camera.name)
+                    task.signals.finished.connect(self._on_snapshot_saved)
+                    QThreadPool.globalInstance().start(task)
                 else:
                     print("Save operation was canceled.")
             except Exception as e:
@@ -3890,10 +4951,28 @@ class Windows(QMainWindow):
         else:
             print("No visible pixmap available for snapshot.")
 
+    def _on_snapshot_saved(self, camera_name: str, path: str, saved: bool) -> None:
+        """
+        Report the result of a snapshot saved by a SnapshotSaveTask.
+        
+        Args:
+            camera_name: Name of the camera the snapshot was taken from
+            path: File path the snapshot was written to
+            saved: True if the file was written successfully
+        """
+        if saved:
+            print(f"Snapshot saved to {path}")
+            self.update_status_bar(f"Snapshot saved: {camera_name}", "", "")
+        else:
+            print("Failed to save snapshot.")
+
     def open_camera_settings(self) -> None:
         """Open the multi-camera settings dialog."""
         # Create an instance of the CameraListWidget to manage cameras
         camera_list_widget = CameraListWidget(self.camera_manager, self)
+        # Delete the dialog once closed so its CameraManager slots are
+        # disconnected instead of firing for every later camera change
+        camera_list_widget.setAttribute(Qt.WA_DeleteOnClose)
         camera_list_widget.exec_()  # show the camera list dialog
 
     def update_camera_settings(self, camera_settings: dict) -> None:
@@ -3905,14 +4984,7 @@ class Windows(QMainWindow):
             self.ip = camera_settings['IP Address']
             self.port = int(camera_settings['Port Number'])
             self.stream_path = camera_settings['Stream Path']
-            if camera_settings['Video Resolution'] == '1080p':
-                self.video_resolution = (1920, 1080)
-            elif camera_settings['Video Resolution'] == '720p':
-                self.video_resolution = (1280, 720)
-            elif camera_settings['Video Resolution'] == '480p':
-                self.video_resolution = (640, 480)
-            else:
-                self.video_resolution = (1920, 1080)
+            self.video_resolution = _RES_MAP.get(camera_settings['Video Resolution'], (1920, 1080))
 
             if self.ip:
                 # Update the url.
@@ -3967,8 +5039,9 @@ class Windows(QMainWindow):
         self.app_settings.setValue('ip', self.ip)
         self.app_settings.setValue('port', self.port)
         self.app_settings.setValue('stream_path', self.stream_path)
-        # Convert tuple to string and persist it
-        self.app_settings.setValue('video_resolution', str(self.video_resolution))
+        # Persist the resolution as two integers
+        self.app_settings.setValue('res_w', self.video_resolution[0])
+        self.app_settings.setValue('res_h', self.video_resolution[1])
     
     def create_camera_panel(self, camera_instance: CameraInstance) -> None:
         """
@@ -3988,29 +5061,18 @@ class Windows(QMainWindow):
         
         # Connect camera stream signals to panel
         if camera_instance.stream_thread:
-            camera_instance.stream_thread.frame_received.connect(
-                lambda camera_id, frame: self._on_frame_received(camera_id, frame)
-            )
-            camera_instance.stream_thread.error_signal.connect(
-                lambda camera_id, error: self._on_camera_error(camera_id, error)
-            )
-            camera_instance.stream_thread.first_frame_received.connect(
-                lambda camera_id: self._on_first_frame(camera_id)
-            )
+            self._connect_stream_signals(camera_instance.stream_thread)
         
         # Add panel to layout
-        from PyQt5.QtWidgets import QWidgetItem
-        self.camera_grid_layout.addItem(QWidgetItem(panel))
+        item = QWidgetItem(panel)
+        self.camera_grid_layout.addItem(item)
+        self._panel_layout_items[camera_instance.id] = item
         
         # Store panel reference
         self.camera_panels[camera_instance.id] = panel
         
         # Show the panel
         panel.show()
-        
-        # Refresh tree view to stay in sync with camera manager
-        if hasattr(self, 'camera_tree_view') and self.camera_tree_view:
-            self.camera_tree_view.refresh_tree()
     
     def remove_camera_panel(self, camera_id: str) -> None:
         """
@@ -4034,21 +5096,34 @@ class Windows(QMainWindow):
             pass
         
         # Remove from layout
-        for i in range(self.camera_grid_layout.count()):
-            item = self.camera_grid_layout.itemAt(i)
-            if item and item.widget() == panel:
-                self.camera_grid_layout.takeAt(i)
-                break
+        item = self._panel_layout_items.pop(camera_id, None)
+        if item is not None:
+            self.camera_grid_layout.removeItem(item)
         
         # Remove from dictionary
         del self.camera_panels[camera_id]
         
         # Delete the widget
         panel.deleteLater()
+    
+    def _connect_stream_signals(self, stream_thread: StreamThread) -> None:
+        """
+        Connect a camera's stream thread signals to the window handlers.
         
-        # Refresh tree view to stay in sync with camera manager
-        if hasattr(self, 'camera_tree_view') and self.camera_tree_view:
-            self.camera_tree_view.refresh_tree()
+        Uses Qt.UniqueConnection, so connecting the same thread again (e.g. on
+        restart or retry) does not deliver its signals twice.
+        
+        Args:
+            stream_thread: Stream thread of the camera
+        """
+        for signal, slot in ((stream_thread.frame_received, self._on_frame_received),
+                             (stream_thread.error_signal, self._on_camera_error),
+                             (stream_thread.first_frame_received, self._on_first_frame)):
+            try:
+                signal.connect(slot, Qt.UniqueConnection)
+            except TypeError:
+                # Already connected
+                pass
     
     def _on_frame_received(self, camera_id: str, frame: np.ndarray) -> None:
         """
@@ -4058,8 +5133,27 @@ class Windows(QMainWindow):
             camera_id: ID of camera that sent the frame
             frame: Video frame as numpy array
         """
-        if camera_id in self.camera_panels:
-            panel = self.camera_panels[camera_id]
+        # Keep only the newest frame; rendering happens once the queued
+        # frame signals have been drained
+        self._latest_frames[camera_id] = frame
+        if not self._frame_render_timer.isActive():
+            self._frame_render_timer.start(0)
+    
+    def _render_latest_frames(self) -> None:
+        """Display the latest pending frame of each camera."""
+        frames, self._latest_frames = self._latest_frames, {}
+        
+        # Nothing is seen while the window is minimized; the pending frames
+        # are dropped and the next ones are shown once it is restored
+        if self.isMinimized():
+            return
+        
+        for camera_id, frame in frames.items():
+            panel = self.camera_panels.get(camera_id)
+            # Skip panels that are hidden (e.g. while another camera is
+            # fullscreen) or entirely covered
+            if panel is None or panel.visibleRegion().isEmpty():
+                continue
             panel.set_frame(frame)
             panel.set_loading(False)
     
@@ -4125,24 +5219,7 @@ class Windows(QMainWindow):
         self.update_control_buttons()
         
         # Update status bar with selected camera info
-        camera = self.camera_manager.get_camera(camera_id)
-        if camera:
-            # Format status message with camera state
-            state_text = camera.state.value.capitalize()
-            status_msg = f"Selected: {camera.name} ({state_text})"
-            
-            # Format URL (hide password for security)
-            if camera.username and camera.password:
-                hidden_password = self.replace_letters_with_asterisks(camera.password)
-                url_display = f"{camera.protocol}://{camera.username}:{hidden_password}@{camera.ip_address}:{camera.port}/{camera.stream_path}"
-            else:
-                url_display = f"{camera.protocol}://{camera.ip_address}:{camera.port}/{camera.stream_path}"
-            
-            self.update_status_bar(
-                status_msg,
-                url_display,
-                f"{camera.resolution}"
-            )
+        self._show_selected_camera_status(camera_id)
     
     def update_control_buttons(self) -> None:
         """
@@ -4152,40 +5229,13 @@ class Windows(QMainWindow):
         and the state of the selected camera.
         """
         selected_camera = self.camera_manager.get_selected_camera()
+        state = selected_camera.state if selected_camera is not None else None
+        start, stop, pause, snapshot = self._BUTTON_STATES[state]
         
-        if selected_camera is None:
-            # No camera selected - disable all control buttons
-            self.start_button.setEnabled(False)
-            self.stop_button.setEnabled(False)
-            self.pause_button.setEnabled(False)
-            self.take_snapshot_button.setEnabled(False)
-        else:
-            # Camera selected - enable buttons based on state
-            if selected_camera.state == CameraState.STOPPED:
-                self.start_button.setEnabled(True)
-                self.stop_button.setEnabled(False)
-                self.pause_button.setEnabled(False)
-                self.take_snapshot_button.setEnabled(False)
-            elif selected_camera.state == CameraState.STARTING:
-                self.start_button.setEnabled(False)
-                self.stop_button.setEnabled(True)
-                self.pause_button.setEnabled(False)
-                self.take_snapshot_button.setEnabled(False)
-            elif selected_camera.state == CameraState.RUNNING:
-                self.start_button.setEnabled(False)
-                self.stop_button.setEnabled(True)
-                self.pause_button.setEnabled(True)
-                self.take_snapshot_button.setEnabled(True)
-            elif selected_camera.state == CameraState.PAUSED:
-                self.start_button.setEnabled(False)
-                self.stop_button.setEnabled(True)
-                self.pause_button.setEnabled(True)
-                self.take_snapshot_button.setEnabled(True)
-            elif selected_camera.state == CameraState.ERROR:
-                self.start_button.setEnabled(True)
-                self.stop_button.setEnabled(False)
-                self.pause_button.setEnabled(False)
-                self.take_snapshot_button.setEnabled(False)
+        self.start_button.setEnabled(start)
+        self.stop_button.setEnabled(stop)
+        self.pause_button.setEnabled(pause)
+        self.take_snapshot_button.setEnabled(snapshot)
     
     def handle_fullscreen_toggle(self, camera_id: str) -> None:
         """
@@ -4226,20 +5276,18 @@ class Windows(QMainWindow):
                 if hasattr(camera, '_pending_new_stream_thread') and camera._pending_new_stream_thread:
                     try:
                         camera._pending_new_stream_thread.frame_received.connect(
-                            lambda cam_id, frame: self._on_frame_received(cam_id, frame)
-                        )
+                            self._on_frame_received, Qt.UniqueConnection)
                     except TypeError:
+                        # Already connected
                         pass
         else:
             # Enter fullscreen mode - switch to higher resolution smoothly
             panel.enter_fullscreen()
             
-            # Find the layout item for this panel
-            for i in range(self.camera_grid_layout.count()):
-                item = self.camera_grid_layout.itemAt(i)
-                if item and item.widget() == panel:
-                    self.camera_grid_layout.set_fullscreen(item)
-                    break
+            # Show the layout item of this panel fullscreen
+            item = self._panel_layout_items.get(camera_id)
+            if item is not None:
+                self.camera_grid_layout.set_fullscreen(item)
             
             # If camera is streaming, smoothly transition to higher resolution
             if camera.state == CameraState.RUNNING:
@@ -4253,9 +5301,9 @@ class Windows(QMainWindow):
                 if hasattr(camera, '_pending_new_stream_thread') and camera._pending_new_stream_thread:
                     try:
                         camera._pending_new_stream_thread.frame_received.connect(
-                            lambda cam_id, frame: self._on_frame_received(cam_id, frame)
-                        )
+                            self._on_frame_received, Qt.UniqueConnection)
                     except TypeError:
+                        # Already connected
                         pass
     
     def handle_camera_reorder(self, source_id: str, target_id: str) -> None:
@@ -4269,18 +5317,9 @@ class Windows(QMainWindow):
             source_id: ID of camera being dragged
             target_id: ID of camera being dropped onto
         """
-        # Get camera instances
-        cameras = self.camera_manager.get_all_cameras()
-        
         # Find indices of source and target cameras
-        source_index = -1
-        target_index = -1
-        
-        for i, camera in enumerate(cameras):
-            if camera.id == source_id:
-                source_index = i
-            if camera.id == target_id:
-                target_index = i
+        source_index = self.camera_manager.index_of(source_id)
+        target_index = self.camera_manager.index_of(target_id)
         
         if source_index == -1 or target_index == -1:
             return
@@ -4289,20 +5328,12 @@ class Windows(QMainWindow):
         # We need to move source to target position
         self.camera_manager.reorder_cameras(source_id, target_index)
         
-        # Find layout items for source and target panels
-        source_item_index = -1
-        target_item_index = -1
-        
-        for i in range(self.camera_grid_layout.count()):
-            item = self.camera_grid_layout.itemAt(i)
-            if item and item.widget() == self.camera_panels.get(source_id):
-                source_item_index = i
-            if item and item.widget() == self.camera_panels.get(target_id):
-                target_item_index = i
-        
-        # Swap items in layout
-        if source_item_index != -1 and target_item_index != -1:
-            self.camera_grid_layout.swap_items(source_item_index, target_item_index)
+        # Swap the layout items of the source and target panels
+        source_item = self._panel_layout_items.get(source_id)
+        target_item = self._panel_layout_items.get(target_id)
+        items = self.camera_grid_layout.items
+        if source_item in items and target_item in items:
+            self.camera_grid_layout.swap_items(items.index(source_item), items.index(target_item))
     
     def handle_camera_retry(self, camera_id: str) -> None:
         """
@@ -4324,32 +5355,11 @@ class Windows(QMainWindow):
             panel.set_error("")
             panel.set_loading(True)
         
-        # Stop any existing stream
-        if camera.stream_thread and camera.stream_thread.isRunning():
-            camera.stop_stream()
-        
-        # Clear error state in camera instance
-        camera.error_message = ""
-        camera.state = CameraState.STOPPED
-        
-        # Start the stream again
-        camera.start_stream()
-        
-        # Connect stream signals if not already connected
-        if camera.stream_thread:
-            try:
-                camera.stream_thread.frame_received.connect(
-                    lambda cam_id, frame: self._on_frame_received(cam_id, frame)
-                )
-                camera.stream_thread.error_signal.connect(
-                    lambda cam_id, error: self._on_camera_error(cam_id, error)
-                )
-                camera.stream_thread.first_frame_received.connect(
-                    lambda cam_id: self._on_first_frame(cam_id)
-                )
-            except TypeError:
-                # Signals may already be connected
-                pass
+        # The stream thread is reused, but one adopted by a smooth resolution
+        # switch only has its frames connected to the window
+        if camera.stream_thread is not None:
+            self._connect_stream_signals(camera.stream_thread)
+        camera.restart_stream()
     
     def _on_camera_added(self, camera_id: str) -> None:
         """
@@ -4361,8 +5371,8 @@ class Windows(QMainWindow):
         camera = self.camera_manager.get_camera(camera_id)
         if camera:
             self.create_camera_panel(camera)
-            # Refresh tree view to show new camera
-            self.camera_tree_view.refresh_tree()
+            # Add the new camera to the tree view
+            self.camera_tree_view.add_camera(camera_id)
     
     def _on_camera_removed(self, camera_id: str) -> None:
         """
@@ -4372,35 +5382,59 @@ class Windows(QMainWindow):
             camera_id: ID of camera that was removed
         """
         self.remove_camera_panel(camera_id)
-        # Refresh tree view to remove camera
-        self.camera_tree_view.refresh_tree()
+        # Remove camera from the tree view
+        self.camera_tree_view.remove_camera(camera_id)
         self.update_control_buttons()
     
+    def _on_camera_updated(self, camera_id: str) -> None:
+        """
+        Handle camera_updated signal from CameraManager.
+        
+        Args:
+            camera_id: ID of camera that was edited
+        """
+        # An edit may rename the camera or move it to another location
+        self.camera_tree_view.refresh_tree()
+    
     def _on_cameras_reordered(self) -> None:
         """
         Handle cameras_reordered signal from CameraManager.
         
-        Rebuilds the camera grid layout to reflect the new order.
+        Puts the existing panel layout items in the new camera order. The
+        panels stay children of the grid container, so the grid is laid
+        out and repainted once instead of once per panel.
         """
-        # Clear all panels from layout
-        while self.camera_grid_layout.count() > 0:
-            item = self.camera_grid_layout.takeAt(0)
-            if item:
-                widget = item.widget()
-                if widget:
-                    widget.setParent(None)
-        
-        # Re-add panels in new order
-        cameras = self.camera_manager.get_all_cameras()
-        for camera in cameras:
-            if camera.id in self.camera_panels:
-                panel = self.camera_panels[camera.id]
-                from PyQt5.QtWidgets import QWidgetItem
-                self.camera_grid_layout.addItem(QWidgetItem(panel))
-                panel.show()
+        container = self.camera_grid_container
+        container.setUpdatesEnabled(False)
+        try:
+            items = [self._panel_layout_items[camera.id]
+                     for camera in self.camera_manager.get_all_cameras()
+                     if camera.id in self._panel_layout_items]
+            # Keep any item without a camera at the end rather than dropping it
+            placed = set(items)
+            items.extend(item for item in self.camera_grid_layout.items if item not in placed)
+            self.camera_grid_layout.set_items(items)
+        finally:
+            container.setUpdatesEnabled(True)
+    
+    def _show_selected_camera_status(self, camera_id: str) -> None:
+        """
+        Show the selected camera's state, masked URL and resolution in the status bar.
         
-        # Refresh tree view to reflect new order
-        self.camera_tree_view.refresh_tree()
+        Args:
+            camera_id: ID of the selected camera
+        """
+        camera = self.camera_manager.get_camera(camera_id)
+        if camera:
+            # Format status message with camera state
+            state_text = camera.state.value.capitalize()
+            status_msg = f"Selected: {camera.name} ({state_text})"
+            
+            self.update_status_bar(
+                status_msg,
+                camera.get_display_url(),  # Password is masked
+                f"{camera.resolution}"
+            )
     
     def _on_selection_changed(self, camera_id: str) -> None:
         """
@@ -4417,24 +5451,7 @@ class Windows(QMainWindow):
         self.update_control_buttons()
         
         # Update status bar
-        camera = self.camera_manager.get_camera(camera_id)
-        if camera:
-            # Format status message with camera state
-            state_text = camera.state.value.capitalize()
-            status_msg = f"Selected: {camera.name} ({state_text})"
-            
-            # Format URL (hide password for security)
-            if camera.username and camera.password:
-                hidden_password = self.replace_letters_with_asterisks(camera.password)
-                url_display = f"{camera.protocol}://{camera.username}:{hidden_password}@{camera.ip_address}:{camera.port}/{camera.stream_path}"
-            else:
-                url_display = f"{camera.protocol}://{camera.ip_address}:{camera.port}/{camera.stream_path}"
-            
-            self.update_status_bar(
-                status_msg,
-                url_display,
-                f"{camera.resolution}"
-            )
+        self._show_selected_camera_status(camera_id)
     
     def handle_tree_camera_selection(self, camera_id: str) -> None:
         """
@@ -4495,222 +5512,27 @@ class Windows(QMainWindow):
             - Text Secondary: #CCCCCC (light gray)
             - Border: #3F3F3F (medium gray)
         """
-        # Define the global dark theme stylesheet
-        dark_theme_stylesheet = """
-            /* Global application styling */
-            QMainWindow {
-                background-color: #1E1E1E;
-                color: #FFFFFF;
-            }
-            
-            QWidget {
-                background-color: #1E1E1E;
-                color: #FFFFFF;
-            }
-            
-            /* Button styling */
-            QPushButton {
-                background-color: #2D2D2D;
-                color: #FFFFFF;
-                border: 1px solid #3F3F3F;
-                padding: 8px 16px;
-                border-radius: 4px;
-                font-size: 13px;
-                font-weight: 500;
-            }
-            
-            QPushButton:hover {
-                background-color: #3F3F3F;
-                border: 1px solid #0078D7;
-            }
-            
-            QPushButton:pressed {
-                background-color: #0078D7;
-                border: 1px solid #0078D7;
-            }
-            
-            QPushButton:disabled {
-                background-color: #1E1E1E;
-                color: rgba(255, 255, 255, 0.5);
-                border: 1px solid #2D2D2D;
-            }
-            
-            /* Label styling */
-            QLabel {
-                background-color: transparent;
-                color: #FFFFFF;
-            }
-            
-            /* Line edit styling */
-            QLineEdit {
-                background-color: #2D2D2D;
-                color: #FFFFFF;
-                border: 1px solid #3F3F3F;
-                padding: 6px;
-                border-radius: 4px;
-                selection-background-color: #0078D7;
-            }
-            
-            QLineEdit:focus {
-                border: 1px solid #0078D7;
-            }
-            
-            /* Combo box styling */
-            QComboBox {
-                background-color: #2D2D2D;
-                color: #FFFFFF;
-                border: 1px solid #3F3F3F;
-                padding: 6px;
-                border-radius: 4px;
-            }
-            
-            QComboBox:hover {
-                border: 1px solid #0078D7;
-            }
-            
-            QComboBox::drop-down {
-                border: none;
-                background-color: #3F3F3F;
-                width: 20px;
-            }
-            
-            QComboBox::down-arrow {
-                image: none;
-                border-left: 4px solid transparent;
-                border-right: 4px solid transparent;
-                border-top: 6px solid #FFFFFF;
-                margin-right: 6px;
-            }
-            
-            QComboBox QAbstractItemView {
-                background-color: #2D2D2D;
-                color: #FFFFFF;
-                border: 1px solid #3F3F3F;
-                selection-background-color: #0078D7;
-            }
-            
-            /* List widget styling */
-            QListWidget {
-                background-color: #2D2D2D;
-                color: #FFFFFF;
-                border: 1px solid #3F3F3F;
-                border-radius: 4px;
-            }
-            
-            QListWidget::item {
-                padding: 8px;
-                border-bottom: 1px solid #3F3F3F;
-            }
-            
-            QListWidget::item:selected {
-                background-color: rgba(0, 120, 215, 0.3);
-                color: #FFFFFF;
-            }
-            
-            QListWidget::item:hover {
-                background-color: #3F3F3F;
-            }
-            
-            /* Tree widget styling */
-            QTreeWidget {
-                background-color: #252525;
-                color: #FFFFFF;
-                border: none;
-                outline: none;
-            }
-            
-            QTreeWidget::item {
-                padding: 6px;
-                border: none;
-            }
-            
-            QTreeWidget::item:selected {
-                background-color: rgba(0, 120, 215, 0.3);
-                color: #FFFFFF;
-            }
-            
-            QTreeWidget::item:hover {
-                background-color: #3F3F3F;
-            }
-            
-            QTreeWidget::branch {
-                background-color: #252525;
-            }
-            
-            /* Dialog styling */
-            QDialog {
-                background-color: #1E1E1E;
-                color: #FFFFFF;
-            }
-            
-            /* Status bar styling */
-            QStatusBar {
-                background-color: #2D2D2D;
-                color: #CCCCCC;
-                border-top: 1px solid #3F3F3F;
-            }
-            
-            QStatusBar QLabel {
-                color: #CCCCCC;
-            }
-            
-            /* Scroll bar styling */
-            QScrollBar:vertical {
-                background-color: #1E1E1E;
-                width: 12px;
-                border: none;
-            }
-            
-            QScrollBar::handle:vertical {
-                background-color: #3F3F3F;
-                border-radius: 6px;
-                min-height: 20px;
-            }
-            
-            QScrollBar::handle:vertical:hover {
-                background-color: #0078D7;
-            }
-            
-            QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {
-                height: 0px;
-            }
-            
-            QScrollBar:horizontal {
-                background-color: #1E1E1E;
-                height: 12px;
-                border: none;
-            }
-            
-            QScrollBar::handle:horizontal {
-                background-color: #3F3F3F;
-                border-radius: 6px;
-                min-width: 20px;
-            }
-            
-            QScrollBar::handle:horizontal:hover {
-                background-color: #0078D7;
-            }
-            
-            QScrollBar::add-line:horizontal, QScrollBar::sub-line:horizontal {
-                width: 0px;
-            }
-        """
+        # Setting a stylesheet re-polishes every child widget, so skip it
+        # when the theme is already applied
+        if self.styleSheet() == _DARK_THEME_QSS:
+            return
         
         # Apply the stylesheet to the application
-        self.setStyleSheet(dark_theme_stylesheet)
+        self.setStyleSheet(_DARK_THEME_QSS)
 
     def wheelEvent(self, event: QWheelEvent) -> None:
         """
         Handle mouse wheel events to zoom in and out on the video stream.
         """
-        # Adjust the zoom factor based on the mouse wheel scrolling
-        if event.angleDelta().y() > 0:
-            self.zoom_factor *= 1.1  # Zoom in
-        else:
-            self.zoom_factor /= 1.1  # Zoom out
+        # Step the zoom level based on the mouse wheel scrolling, within the
+        # zoom range
+        step = 1 if event.angleDelta().y() > 0 else -1
+        level = max(-_ZOOM_STEPS, min(self.zoom_level + step, _ZOOM_STEPS))
+        if level == self.zoom_level:
+            return
 
-        # Ensure zoom factor stays within a reasonable range
-        self.zoom_factor = max(0.1, min(self.zoom_factor, 10))
+        self.zoom_level = level
+        self.zoom_factor = _ZOOM_TABLE[level + _ZOOM_STEPS]
 
     def mousePressEvent(self, event: QMouseEvent) -> None:
         """
@@ -4758,18 +5580,34 @@ class Windows(QMainWindow):
         Args:
             event: Close event
         """
-        # Stop all camera streams
+        # Stop all camera streams. Each stop joins its capture thread, so the
+        # joins run concurrently in the pool instead of one after another
         cameras = self.camera_manager.get_all_cameras()
+        pool = QThreadPool.globalInstance()
         for camera in cameras:
             if camera.stream_thread and camera.stream_thread.isRunning():
-                camera.stop_stream()
+                pool.start(StreamStopTask(camera.stream_thread))
+        if not pool.waitForDone(2000):
+            # A camera that is still connecting only stops once its connection
+            # attempt ends; its thread must not outlive the window, so wait for
+            # the pool's stop instead of starting a second one here
+            for camera in cameras:
+                if camera.stream_thread is not None and camera.stream_thread.isRunning():
+                    camera.stream_thread.wait()
+            pool.waitForDone()
+        # Record the stopped state of the cameras whose threads have stopped
+        for camera in cameras:
+            if camera.stream_thread is not None and not camera.stream_thread.isRunning():
+                camera.state = CameraState.STOPPED
+                camera.error_message = ""
         
-        # Stop loading animations in all panels
+        # Stop loading animations in the panels that are showing one
         for panel in self.camera_panels.values():
-            panel.set_loading(False)
+            if panel.is_loading:
+                panel.set_loading(False)
         
-        # Save camera manager settings with error handling
-        if not self.camera_manager.save_to_settings():
+        # Save camera manager settings and sync them now, with error handling
+        if not (self.camera_manager.save_to_settings() and self.camera_manager.flush_settings()):
             # Log error but don't block closing
             print("Warning: Failed to save camera settings on application close")
             # Show a brief warning to user
@@ -0,0 +1,23 @@
+"""
+Shared pytest fixtures for the IP Camera Player tests.
+"""
+
+import sys
+import pytest
+from PyQt5.QtCore import QSettings
+from PyQt5.QtWidgets import QApplication
+
+
+@pytest.fixture(scope="session")
+def qapp():
+    """Create the QApplication instance once for the whole test session."""
+    app = QApplication.instance()
+    if app is None:
+        app = QApplication(sys.argv)
+    yield app
+
+
+@pytest.fixture
+def settings(tmp_path):
+    """Create QSettings backed by an INI file private to the test."""
+    return QSettings(str(tmp_path / "settings.ini"), QSettings.IniFormat)
@@ -5,18 +5,13 @@ This script tests the CameraConfigDialog and CameraListWidget
 to ensure they work correctly with the CameraManager.
 """
 
-import sys
-from PyQt5.QtWidgets import QApplication
-from PyQt5.QtCore import QSettings
+from PyQt5.QtWidgets import QMessageBox
+from PyQt5.QtCore import Qt
 from ip_camera_player import CameraManager, CameraListWidget, CameraConfigDialog
 
 
-def test_camera_config_dialog():
+def test_camera_config_dialog(qapp):
     """Test CameraConfigDialog in add mode."""
-    print("Testing CameraConfigDialog...")
-    
-    app = QApplication(sys.argv)
-    
     # Test add mode
     dialog = CameraConfigDialog()
     
@@ -41,25 +36,21 @@ def test_camera_config_dialog():
     
     # Test get_camera_data
     data = dialog.get_camera_data()
-    assert data["name"] == "Test Camera"
-    assert data["ip_address"] == "192.168.1.100"
-    assert data["port"] == 554
-    assert data["protocol"] == "rtsp"
-    assert data["resolution"] == (1920, 1080)
-    
-    print("✓ CameraConfigDialog tests passed")
+    assert data == {
+        "name": "Test Camera",
+        "location": "Default",
+        "protocol": "rtsp",
+        "username": "",
+        "password": "",
+        "ip_address": "192.168.1.100",
+        "port": 554,
+        "stream_path": "",
+        "resolution": (1920, 1080)
+    }
 
 
-def test_camera_list_widget():
+def test_camera_list_widget(qapp, settings):
     """Test CameraListWidget with CameraManager."""
-    print("Testing CameraListWidget...")
-    
-    app = QApplication(sys.argv)
-    
-    # Create settings and camera manager
-    settings = QSettings('TestOrg', 'TestApp')
-    settings.clear()  # Clear any existing settings
-    
     camera_manager = CameraManager(settings)
     
     # Add some test cameras
@@ -101,20 +92,98 @@ def test_camera_list_widget():
     # Verify buttons are now enabled
     assert list_widget.edit_button.isEnabled()
     assert list_widget.delete_button.isEnabled()
+
+
+def test_camera_list_widget_incremental_updates(qapp, settings):
+    """Test CameraListWidget updates single rows on CameraManager signals."""
+    camera_manager = CameraManager(settings)
+    first_id = camera_manager.add_camera({
+        "name": "Front Door",
+        "ip_address": "192.168.1.100"
+    })
+    
+    list_widget = CameraListWidget(camera_manager)
+    first_item = list_widget.camera_list_view.item(0)
     
-    print("✓ CameraListWidget tests passed")
+    # Adding a camera appends a row without recreating existing ones
+    second_id = camera_manager.add_camera({
+        "name": "Back Yard",
+        "ip_address": "192.168.1.101"
+    })
+    assert list_widget.camera_list_view.count() == 2
+    assert list_widget.camera_list_view.item(0) is first_item
+    assert list_widget.camera_list_view.item(1).data(Qt.UserRole) == second_id
+    
+    # Updating a camera mutates its row in place
+    camera_manager.get_camera(first_id).name = "Front Gate"
+    camera_manager.camera_updated.emit(first_id)
+    assert list_widget.camera_list_view.item(0) is first_item
+    assert "Front Gate" in first_item.text()
+    
+    # Removing a camera takes only its row
+    camera_manager.remove_camera(first_id)
+    assert list_widget.camera_list_view.count() == 1
+    assert list_widget.camera_list_view.item(0).data(Qt.UserRole) == second_id
+    assert first_id not in list_widget._items
 
 
-def test_integration():
-    """Test integration between components."""
-    print("Testing integration...")
+def test_camera_list_widget_delete_confirmation(qapp, settings):
+    """Test deleting a camera through the non-blocking confirmation box."""
+    camera_manager = CameraManager(settings)
+    camera_id = camera_manager.add_camera({
+        "name": "Front Door",
+        "ip_address": "192.168.1.100"
+    })
     
-    app = QApplication(sys.argv)
+    list_widget = CameraListWidget(camera_manager)
+    list_widget.camera_list_view.setCurrentRow(0)
     
-    # Create settings and camera manager
-    settings = QSettings('TestOrg', 'TestApp')
-    settings.clear()
+    # handle_delete returns immediately with the confirmation box open
+    list_widget.handle_delete()
+    box = list_widget.findChild(QMessageBox)
+    assert box is not None
+    assert camera_manager.get_camera(camera_id) is not None
     
+    # Answering the box removes the camera
+    box.done(QMessageBox.Yes)
+    assert camera_manager.get_camera(camera_id) is None
+
+
+def test_camera_list_widget_reuses_config_dialog(qapp, settings):
+    """Test that the camera form is built once and reset between uses."""
+    camera_manager = CameraManager(settings)
+    camera_id = camera_manager.add_camera({
+        "name": "Front Door",
+        "ip_address": "192.168.1.100",
+        "port": 8554
+    })
+    
+    list_widget = CameraListWidget(camera_manager)
+    
+    # Edit mode loads the camera into the form
+    list_widget.show_camera_form(camera_id)
+    dialog = list_widget._camera_config_dialog
+    assert dialog.windowTitle() == "Edit Camera"
+    assert dialog.name_line_edit.text() == "Front Door"
+    dialog.reject()
+    
+    # Add mode reuses the same dialog with defaults restored
+    list_widget.show_camera_form()
+    assert list_widget._camera_config_dialog is dialog
+    assert dialog.windowTitle() == "Add Camera"
+    assert dialog.name_line_edit.text() == ""
+    assert dialog.port_line_edit.text() == "554"
+    
+    # Accepting the form adds the camera
+    dialog.name_line_edit.setText("Back Yard")
+    dialog.ip_address_line_edit.setText("192.168.1.101")
+    dialog.accept()
+    assert len(camera_manager.get_all_cameras()) == 2
+
+
+def test_integration(qapp, settings):
+    """Test integration between components."""
+    # Create settings and camera manager
     camera_manager = CameraManager(settings)
     
     # Add a camera
@@ -148,21 +217,3 @@ def test_integration():
     cameras = camera_manager2.get_all_cameras()
     assert len(cameras) == 1
     assert cameras[0].name == "Test Camera"
-    
-    print("✓ Integration tests passed")
-
-
-if __name__ == '__main__':
-    try:
-        test_camera_config_dialog()
-        test_camera_list_widget()
-        test_integration()
-        print("\n✅ All tests passed!")
-    except AssertionError as e:
-        print(f"\n❌ Test failed: {e}")
-        sys.exit(1)
-    except Exception as e:
-        print(f"\n❌ Unexpected error: {e}")
-        import traceback
-        traceback.print_exc()
-        sys.exit(1)
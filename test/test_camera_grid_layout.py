@@ -1,99 +1,85 @@
 """
 Test to verify CameraGridLayout functionality.
 """
-import sys
-from PyQt5.QtWidgets import QApplication, QWidget, QWidgetItem
-from PyQt5.QtCore import QRect
+import pytest
+from PyQt5.QtWidgets import QWidget, QWidgetItem
+from PyQt5.QtCore import QRect, QPoint
 from ip_camera_player import CameraGridLayout, CameraPanel, CameraInstance
 
 
-def test_camera_grid_layout_instantiation():
+@pytest.fixture(scope="module")
+def panel_pool(qapp):
+    """Create the camera panels shared by the layout tests."""
+    return [
+        CameraPanel(CameraInstance(name=f"Camera {i + 1}", ip_address=f"192.168.1.{100 + i}"))
+        for i in range(4)
+    ]
+
+
+@pytest.fixture
+def panels(panel_pool):
+    """Lend the shared panels to a test and detach them from its layout afterwards."""
+    yield panel_pool
+    for panel in panel_pool:
+        panel.setParent(None)
+
+
+def test_camera_grid_layout_instantiation(qapp):
     """Test that CameraGridLayout can be created."""
-    app = QApplication(sys.argv)
-    
     layout = CameraGridLayout()
     
     assert layout is not None
     assert layout.count() == 0
     assert layout.fullscreen_item is None
-    
-    print("✓ CameraGridLayout instantiation test passed")
-    return True
 
 
-def test_add_remove_items():
+def test_add_remove_items(panels):
     """Test adding and removing items from the layout."""
-    app = QApplication(sys.argv)
-    
     layout = CameraGridLayout()
-    
-    # Create camera instances and panels
-    camera1 = CameraInstance(name="Camera 1", ip_address="192.168.1.100")
-    camera2 = CameraInstance(name="Camera 2", ip_address="192.168.1.101")
-    
-    panel1 = CameraPanel(camera1)
-    panel2 = CameraPanel(camera2)
+    panel1, panel2 = panels[:2]
     
     # Add items
     layout.addWidget(panel1)
     layout.addWidget(panel2)
     
     assert layout.count() == 2
-    print("✓ Add items test passed")
     
     # Remove item
     item = layout.takeAt(0)
     assert layout.count() == 1
     assert item is not None
-    
-    print("✓ Remove items test passed")
-    return True
 
 
-def test_grid_dimension_calculation():
+@pytest.fixture(scope="module")
+def grid_layout(qapp):
+    """Create one CameraGridLayout shared by the dimension tests."""
+    return CameraGridLayout()
+
+
+@pytest.mark.parametrize("count,expected", [
+    (0, (0, 0)),
+    (1, (1, 1)),
+    (2, (1, 2)),
+    (3, (1, 3)),
+    (4, (2, 2)),
+    (5, (2, 3)),
+    (6, (2, 3)),
+    (7, (2, 4)),
+    (8, (2, 4)),
+    (9, (3, 3)),
+    (10, (3, 4)),
+    (12, (3, 4)),
+    (16, (4, 4)),
+])
+def test_grid_dimension_calculation(grid_layout, count, expected):
     """Test the grid dimension calculation algorithm."""
-    app = QApplication(sys.argv)
-    
-    layout = CameraGridLayout()
-    
-    # Test various camera counts
-    test_cases = [
-        (0, (0, 0)),
-        (1, (1, 1)),
-        (2, (1, 2)),
-        (3, (1, 3)),
-        (4, (2, 2)),
-        (5, (2, 3)),
-        (6, (2, 3)),
-        (7, (2, 4)),
-        (8, (2, 4)),
-        (9, (3, 3)),
-        (10, (3, 4)),
-        (12, (3, 4)),
-        (16, (4, 4)),
-    ]
-    
-    for count, expected in test_cases:
-        result = layout.calculate_grid_dimensions(count)
-        assert result == expected, f"For count {count}, expected {expected} but got {result}"
-        print(f"  ✓ {count} cameras -> {result[0]}x{result[1]} grid")
-    
-    print("✓ Grid dimension calculation test passed")
-    return True
+    assert grid_layout.calculate_grid_dimensions(count) == expected
 
 
-def test_fullscreen_mode():
+def test_fullscreen_mode(panels):
     """Test fullscreen mode functionality."""
-    app = QApplication(sys.argv)
-    
     layout = CameraGridLayout()
-    
-    # Create camera instances and panels
-    camera1 = CameraInstance(name="Camera 1", ip_address="192.168.1.100")
-    camera2 = CameraInstance(name="Camera 2", ip_address="192.168.1.101")
-    
-    panel1 = CameraPanel(camera1)
-    panel2 = CameraPanel(camera2)
+    panel1, panel2 = panels[:2]
     
     layout.addWidget(panel1)
     layout.addWidget(panel2)
@@ -105,31 +91,16 @@ def test_fullscreen_mode():
     # Set fullscreen
     layout.set_fullscreen(item1)
     assert layout.fullscreen_item == item1
-    print("  ✓ Fullscreen mode set")
     
     # Clear fullscreen
     layout.clear_fullscreen()
     assert layout.fullscreen_item is None
-    print("  ✓ Fullscreen mode cleared")
-    
-    print("✓ Fullscreen mode test passed")
-    return True
 
 
-def test_swap_items():
+def test_swap_items(panels):
     """Test item swapping functionality."""
-    app = QApplication(sys.argv)
-    
     layout = CameraGridLayout()
-    
-    # Create camera instances and panels
-    camera1 = CameraInstance(name="Camera 1", ip_address="192.168.1.100")
-    camera2 = CameraInstance(name="Camera 2", ip_address="192.168.1.101")
-    camera3 = CameraInstance(name="Camera 3", ip_address="192.168.1.102")
-    
-    panel1 = CameraPanel(camera1)
-    panel2 = CameraPanel(camera2)
-    panel3 = CameraPanel(camera3)
+    panel1, panel2, panel3 = panels[:3]
     
     layout.addWidget(panel1)
     layout.addWidget(panel2)
@@ -148,30 +119,22 @@ def test_swap_items():
     
     assert item0_after == item1_before
     assert item1_after == item0_before
-    
-    print("✓ Swap items test passed")
-    return True
 
 
-def test_geometry_calculation():
-    """Test that setGeometry positions panels correctly."""
-    app = QApplication(sys.argv)
-    
-    # Create a container widget
+@pytest.fixture
+def container(panels):
+    """Create a container widget, releasing the shared panels before it is deleted."""
     container = QWidget()
+    yield container
+    for panel in panels:
+        panel.setParent(None)
+
+
+def test_geometry_calculation(container, panels):
+    """Test that setGeometry positions panels correctly."""
     layout = CameraGridLayout(container)
     container.setLayout(layout)
-    
-    # Create camera instances and panels
-    camera1 = CameraInstance(name="Camera 1", ip_address="192.168.1.100")
-    camera2 = CameraInstance(name="Camera 2", ip_address="192.168.1.101")
-    camera3 = CameraInstance(name="Camera 3", ip_address="192.168.1.102")
-    camera4 = CameraInstance(name="Camera 4", ip_address="192.168.1.103")
-    
-    panel1 = CameraPanel(camera1)
-    panel2 = CameraPanel(camera2)
-    panel3 = CameraPanel(camera3)
-    panel4 = CameraPanel(camera4)
+    panel1, panel2, panel3, panel4 = panels
     
     layout.addWidget(panel1)
     layout.addWidget(panel2)
@@ -182,26 +145,11 @@ def test_geometry_calculation():
     rect = QRect(0, 0, 800, 600)
     layout.setGeometry(rect)
     
-    # For 4 cameras, should be 2x2 grid
-    # Each panel should be 400x300
+    # Panels fill the fixed 3x3 grid row by row
+    # Each panel takes a third of the width (less spacing) at 16:9
     assert layout.count() == 4
-    print("  ✓ 4 panels positioned in 2x2 grid")
-    
-    print("✓ Geometry calculation test passed")
-    return True
-
-
-if __name__ == '__main__':
-    try:
-        test_camera_grid_layout_instantiation()
-        test_add_remove_items()
-        test_grid_dimension_calculation()
-        test_fullscreen_mode()
-        test_swap_items()
-        test_geometry_calculation()
-        print("\n✓ All CameraGridLayout tests passed!")
-    except Exception as e:
-        print(f"\n✗ Test failed: {e}")
-        import traceback
-        traceback.print_exc()
-        sys.exit(1)
+    geometries = [panel.geometry() for panel in panels]
+    assert all(g.width() == 265 and g.height() == 149 for g in geometries)
+    assert geometries[0].y() == geometries[1].y() == geometries[2].y()
+    assert geometries[0].x() < geometries[1].x() < geometries[2].x()
+    assert geometries[3].topLeft() == QPoint(geometries[0].x(), geometries[0].y() + 149 + 2)
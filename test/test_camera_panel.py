@@ -1,14 +1,10 @@
 """
 Simple test to verify CameraPanel can be instantiated.
 """
-import sys
-from PyQt5.QtWidgets import QApplication
 from ip_camera_player import CameraPanel, CameraInstance
 
-def test_camera_panel_instantiation():
+def test_camera_panel_instantiation(qapp):
     """Test that CameraPanel can be created with a CameraInstance."""
-    app = QApplication(sys.argv)
-    
     # Create a camera instance
     camera = CameraInstance(
         name="Test Camera",
@@ -30,22 +26,3 @@ def test_camera_panel_instantiation():
     assert panel.video_label is not None
     assert panel.error_label is not None
     assert panel.loading_animation is not None
-    
-    print("✓ CameraPanel instantiation test passed")
-    print(f"  - Camera ID: {camera.id}")
-    print(f"  - Camera Name: {camera.name}")
-    print(f"  - Panel has video_label: {panel.video_label is not None}")
-    print(f"  - Panel has error_label: {panel.error_label is not None}")
-    print(f"  - Panel has loading_animation: {panel.loading_animation is not None}")
-    
-    return True
-
-if __name__ == '__main__':
-    try:
-        test_camera_panel_instantiation()
-        print("\n✓ All tests passed!")
-    except Exception as e:
-        print(f"\n✗ Test failed: {e}")
-        import traceback
-        traceback.print_exc()
-        sys.exit(1)
@@ -1,19 +1,43 @@
 """
 Comprehensive tests for CameraPanel features.
 """
-import sys
 import numpy as np
-from PyQt5.QtWidgets import QApplication
-from PyQt5.QtCore import QPoint
-from ip_camera_player import CameraPanel, CameraInstance
+import pytest
+from PyQt5.QtCore import QPoint, QPointF, Qt
+from PyQt5.QtGui import QWheelEvent
+from ip_camera_player import CameraPanel, CameraInstance, frame_to_qimage, _HAS_BGR888
 
-def test_selection_state():
-    """Test selection state management."""
-    app = QApplication(sys.argv)
-    
+# Test frame shared by the display tests (100x100 black image)
+_FRAME = np.zeros((100, 100, 3), dtype=np.uint8)
+
+
+@pytest.fixture(scope="module")
+def shared_panel(qapp):
+    """Create one CameraPanel for the whole module."""
     camera = CameraInstance(name="Test Camera", ip_address="192.168.1.100")
-    panel = CameraPanel(camera)
-    
+    return CameraPanel(camera)
+
+
+@pytest.fixture
+def panel(shared_panel):
+    """Reset the shared CameraPanel to its initial state for a test."""
+    shared_panel.set_selected(False)
+    shared_panel.set_loading(False)
+    # Restore the error widgets as constructed; set_error("") and
+    # set_loading() would leave the label hidden for the next test
+    shared_panel.accepting_frames = True
+    shared_panel.error_label.show()
+    shared_panel.error_container.hide()
+    if shared_panel.is_fullscreen:
+        shared_panel.exit_fullscreen()
+    shared_panel.zoom_level = 0
+    shared_panel.zoom_factor = 1.0
+    shared_panel.pan_offset = QPoint(0, 0)
+    return shared_panel
+
+
+def test_selection_state(panel):
+    """Test selection state management."""
     # Test initial state
     assert panel.is_selected == False
     
@@ -23,32 +47,23 @@ def test_selection_state():
     
     panel.set_selected(False)
     assert panel.is_selected == False
-    
-    print("✓ Selection state test passed")
 
-def test_loading_state():
+
+def test_loading_state(panel):
     """Test loading animation control."""
-    app = QApplication(sys.argv)
-    
-    camera = CameraInstance(name="Test Camera", ip_address="192.168.1.100")
-    panel = CameraPanel(camera)
-    
     # Test loading state
+    assert not panel.is_loading
     panel.set_loading(True)
     # Loading animation should be started (we can't easily test this without GUI)
+    assert panel.is_loading
     
     panel.set_loading(False)
     # Loading animation should be stopped
-    
-    print("✓ Loading state test passed")
+    assert not panel.is_loading
 
-def test_error_display():
+
+def test_error_display(panel):
     """Test error message display."""
-    app = QApplication(sys.argv)
-    
-    camera = CameraInstance(name="Test Camera", ip_address="192.168.1.100")
-    panel = CameraPanel(camera)
-    
     # Set a size for the panel so positioning works
     panel.resize(400, 300)
     
@@ -62,16 +77,10 @@ def test_error_display():
     # Test clearing error
     panel.set_error("")
     assert panel.error_label.isHidden() == True
-    
-    print("✓ Error display test passed")
 
-def test_zoom_functionality():
+
+def test_zoom_functionality(panel):
     """Test zoom factor management."""
-    app = QApplication(sys.argv)
-    
-    camera = CameraInstance(name="Test Camera", ip_address="192.168.1.100")
-    panel = CameraPanel(camera)
-    
     # Test initial zoom
     assert panel.zoom_factor == 1.0
     
@@ -82,16 +91,32 @@ def test_zoom_functionality():
     # Test zoom out
     panel.zoom_factor /= 1.1
     assert abs(panel.zoom_factor - 1.0) < 0.01
+
+
+def test_wheel_zoom_steps(panel):
+    """Test that wheel zoom moves in exact steps and stops at the limits."""
+    def wheel(delta):
+        panel.wheelEvent(QWheelEvent(QPointF(10, 10), QPointF(10, 10), QPoint(0, 0),
+                                     QPoint(0, delta), Qt.NoButton, Qt.NoModifier,
+                                     Qt.NoScrollPhase, False))
+    
+    # Zooming in and back out returns exactly to no zoom
+    for _ in range(5):
+        wheel(120)
+    for _ in range(5):
+        wheel(-120)
+    assert panel.zoom_level == 0
+    assert panel.zoom_factor == 1.0
     
-    print("✓ Zoom functionality test passed")
+    # Scrolling past the limit keeps the factor at the maximum
+    for _ in range(40):
+        wheel(120)
+    assert panel.zoom_level == 24
+    assert 9.5 < panel.zoom_factor < 10.0
+
 
-def test_pan_offset():
+def test_pan_offset(panel):
     """Test pan offset management."""
-    app = QApplication(sys.argv)
-    
-    camera = CameraInstance(name="Test Camera", ip_address="192.168.1.100")
-    panel = CameraPanel(camera)
-    
     # Test initial pan offset
     assert panel.pan_offset == QPoint(0, 0)
     
@@ -99,16 +124,10 @@ def test_pan_offset():
     panel.pan_offset = QPoint(10, 20)
     assert panel.pan_offset.x() == 10
     assert panel.pan_offset.y() == 20
-    
-    print("✓ Pan offset test passed")
 
-def test_fullscreen_state():
+
+def test_fullscreen_state(panel):
     """Test fullscreen state management."""
-    app = QApplication(sys.argv)
-    
-    camera = CameraInstance(name="Test Camera", ip_address="192.168.1.100")
-    panel = CameraPanel(camera)
-    
     # Test initial state
     assert panel.is_fullscreen == False
     
@@ -119,56 +138,46 @@ def test_fullscreen_state():
     # Test exiting fullscreen
     panel.exit_fullscreen()
     assert panel.is_fullscreen == False
-    
-    print("✓ Fullscreen state test passed")
 
-def test_frame_display():
+
+def test_frame_display(panel):
     """Test frame display with set_frame method."""
-    app = QApplication(sys.argv)
-    
-    camera = CameraInstance(name="Test Camera", ip_address="192.168.1.100")
-    panel = CameraPanel(camera)
-    
-    # Create a test frame (100x100 black image)
-    frame = np.zeros((100, 100, 3), dtype=np.uint8)
-    
     # Test setting frame (should not raise exception)
-    panel.set_frame(frame)
+    panel.set_frame(_FRAME)
     
     # Verify pixmap was set
     assert panel.video_label.pixmap() is not None
-    
-    print("✓ Frame display test passed")
 
-def test_signals_defined():
+
+def test_frame_to_qimage_strided_views(qapp):
+    """Test QImage conversion of cropped and strided frame views."""
+    frame = np.zeros((40, 60, 3), dtype=np.uint8)
+    frame[:, :, 2] = 255  # Pure red in BGR
+    
+    # A crop keeps packed pixels and is wrapped using the frame's row stride
+    image = frame_to_qimage(frame[5:25, 10:50])
+    assert (image.width(), image.height()) == (40, 20)
+    assert image.pixelColor(0, 0).red() == 255
+    
+    # A view that skips columns is packed before wrapping
+    image = frame_to_qimage(frame[:, ::2])
+    assert (image.width(), image.height()) == (30, 40)
+    assert image.pixelColor(29, 39).red() == 255
+    assert image.pixelColor(29, 39).blue() == 0
+
+
+@pytest.mark.skipif(not _HAS_BGR888, reason="QImage.Format_BGR888 needs Qt 5.14")
+def test_frame_to_qimage_shares_packed_frames(qapp):
+    """Test that a packed frame is wrapped in a QImage without a copy."""
+    image = frame_to_qimage(_FRAME)
+    assert int(image.constBits()) == _FRAME.ctypes.data
+    assert image.bytesPerLine() == _FRAME.strides[0]
+
+
+def test_signals_defined(panel):
     """Test that all required signals are defined."""
-    app = QApplication(sys.argv)
-    
-    camera = CameraInstance(name="Test Camera", ip_address="192.168.1.100")
-    panel = CameraPanel(camera)
-    
     # Verify signals exist
     assert hasattr(panel, 'clicked')
     assert hasattr(panel, 'double_clicked')
     assert hasattr(panel, 'drag_started')
     assert hasattr(panel, 'drop_requested')
-    
-    print("✓ Signals definition test passed")
-
-if __name__ == '__main__':
-    try:
-        test_selection_state()
-        test_loading_state()
-        test_error_display()
-        test_zoom_functionality()
-        test_pan_offset()
-        test_fullscreen_state()
-        test_frame_display()
-        test_signals_defined()
-        
-        print("\n✓ All CameraPanel feature tests passed!")
-    except Exception as e:
-        print(f"\n✗ Test failed: {e}")
-        import traceback
-        traceback.print_exc()
-        sys.exit(1)
@@ -5,33 +5,13 @@ Tests the functionality of the CameraTreeView widget including
 tree structure, camera display, and interaction handlers.
 """
 
-import sys
 import pytest
-from PyQt5.QtWidgets import QApplication
-from PyQt5.QtCore import Qt, QSettings
+from PyQt5.QtCore import Qt
 
 # Import the components to test
 from ip_camera_player import CameraTreeView, CameraManager, CameraInstance, CameraState
 
 
-@pytest.fixture(scope="module")
-def qapp():
-    """Create QApplication instance for tests."""
-    app = QApplication.instance()
-    if app is None:
-        app = QApplication(sys.argv)
-    yield app
-
-
-@pytest.fixture
-def settings():
-    """Create a temporary QSettings instance for testing."""
-    settings = QSettings('TestOrg', 'TestApp')
-    settings.clear()
-    yield settings
-    settings.clear()
-
-
 @pytest.fixture
 def camera_manager(settings):
     """Create a CameraManager instance for testing."""
@@ -44,6 +24,22 @@ def tree_view(qapp, camera_manager):
     return CameraTreeView(camera_manager)
 
 
+@pytest.fixture
+def make_camera(camera_manager):
+    """Factory that adds a camera to the manager and returns its instance."""
+    def _make_camera(state=None, **config):
+        camera_id = camera_manager.add_camera({
+            "name": "Test Camera",
+            "ip_address": "192.168.1.100",
+            **config
+        })
+        camera = camera_manager.get_camera(camera_id)
+        if state is not None:
+            camera.state = state
+        return camera
+    return _make_camera
+
+
 def test_tree_view_initialization(tree_view):
     """Test that tree view initializes correctly."""
     assert tree_view.camera_manager is not None
@@ -73,15 +69,10 @@ def test_add_location_duplicate(tree_view):
     assert len(tree_view.location_nodes) == 1
 
 
-def test_add_camera_to_location(tree_view, camera_manager):
+def test_add_camera_to_location(tree_view, make_camera):
     """Test adding a camera to a location."""
     # Create a camera
-    camera_id = camera_manager.add_camera({
-        "name": "Front Door",
-        "ip_address": "192.168.1.100",
-        "port": 554
-    })
-    camera = camera_manager.get_camera(camera_id)
+    camera = make_camera(name="Front Door", port=554)
     
     # Add camera to tree
     camera_item = tree_view.add_camera_to_location(camera, "Entrance")
@@ -93,48 +84,18 @@ def test_add_camera_to_location(tree_view, camera_manager):
     assert camera_item.data(0, Qt.UserRole) == camera.id
 
 
-def test_camera_item_display_stopped(tree_view, camera_manager):
-    """Test camera item display for stopped state."""
-    camera_id = camera_manager.add_camera({
-        "name": "Test Camera",
-        "ip_address": "192.168.1.100"
-    })
-    camera = camera_manager.get_camera(camera_id)
-    camera.state = CameraState.STOPPED
-    
-    camera_item = tree_view.add_camera_to_location(camera, "Test")
-    
-    assert "⚪" in camera_item.text(0)  # White circle for stopped
-    assert "Test Camera" in camera_item.text(0)
-
-
-def test_camera_item_display_running(tree_view, camera_manager):
-    """Test camera item display for running state."""
-    camera_id = camera_manager.add_camera({
-        "name": "Test Camera",
-        "ip_address": "192.168.1.100"
-    })
-    camera = camera_manager.get_camera(camera_id)
-    camera.state = CameraState.RUNNING
-    
-    camera_item = tree_view.add_camera_to_location(camera, "Test")
-    
-    assert "🟢" in camera_item.text(0)  # Green circle for running
-    assert "Test Camera" in camera_item.text(0)
-
-
-def test_camera_item_display_error(tree_view, camera_manager):
-    """Test camera item display for error state."""
-    camera_id = camera_manager.add_camera({
-        "name": "Test Camera",
-        "ip_address": "192.168.1.100"
-    })
-    camera = camera_manager.get_camera(camera_id)
-    camera.state = CameraState.ERROR
+@pytest.mark.parametrize("state,glyph", [
+    (CameraState.STOPPED, "⚪"),  # White circle for stopped
+    (CameraState.RUNNING, "🟢"),  # Green circle for running
+    (CameraState.ERROR, "🔴"),  # Red circle for error
+])
+def test_camera_item_display(tree_view, make_camera, state, glyph):
+    """Test camera item display for each camera state."""
+    camera = make_camera(state=state)
     
     camera_item = tree_view.add_camera_to_location(camera, "Test")
     
-    assert "🔴" in camera_item.text(0)  # Red circle for error
+    assert glyph in camera_item.text(0)
     assert "Test Camera" in camera_item.text(0)
 
 
@@ -144,21 +105,17 @@ def test_get_selected_camera_id_none(tree_view):
     assert camera_id is None
 
 
-def test_select_camera(tree_view, camera_manager):
+def test_select_camera(tree_view, make_camera):
     """Test selecting a camera in the tree."""
     # Add a camera
-    camera_id = camera_manager.add_camera({
-        "name": "Test Camera",
-        "ip_address": "192.168.1.100"
-    })
-    camera = camera_manager.get_camera(camera_id)
+    camera = make_camera()
     tree_view.add_camera_to_location(camera, "Test")
     
     # Select the camera
-    result = tree_view.select_camera(camera_id)
+    result = tree_view.select_camera(camera.id)
     
     assert result == True
-    assert tree_view.get_selected_camera_id() == camera_id
+    assert tree_view.get_selected_camera_id() == camera.id
 
 
 def test_select_camera_nonexistent(tree_view):
@@ -170,14 +127,10 @@ def test_select_camera_nonexistent(tree_view):
 def test_refresh_tree(tree_view, camera_manager):
     """Test refreshing the tree from camera manager."""
     # Add multiple cameras
-    camera1_id = camera_manager.add_camera({
-        "name": "Camera 1",
-        "ip_address": "192.168.1.100"
-    })
-    camera2_id = camera_manager.add_camera({
-        "name": "Camera 2",
-        "ip_address": "192.168.1.101"
-    })
+    camera1_id, camera2_id = camera_manager.add_cameras([
+        {"name": "Camera 1", "ip_address": "192.168.1.100"},
+        {"name": "Camera 2", "ip_address": "192.168.1.101"}
+    ])
     
     # Refresh tree
     tree_view.refresh_tree()
@@ -188,14 +141,10 @@ def test_refresh_tree(tree_view, camera_manager):
     assert "Default" in tree_view.location_nodes  # Default location
 
 
-def test_refresh_tree_preserves_expansion(tree_view, camera_manager):
+def test_refresh_tree_preserves_expansion(tree_view, make_camera):
     """Test that refresh preserves location expansion state."""
     # Add cameras
-    camera_id = camera_manager.add_camera({
-        "name": "Test Camera",
-        "ip_address": "192.168.1.100"
-    })
-    camera = camera_manager.get_camera(camera_id)
+    camera = make_camera()
     tree_view.add_camera_to_location(camera, "Office")
     
     # Collapse the location
@@ -213,14 +162,10 @@ def test_refresh_tree_preserves_expansion(tree_view, camera_manager):
 def test_refresh_tree_preserves_selection(tree_view, camera_manager):
     """Test that refresh preserves camera selection."""
     # Add cameras
-    camera1_id = camera_manager.add_camera({
-        "name": "Camera 1",
-        "ip_address": "192.168.1.100"
-    })
-    camera2_id = camera_manager.add_camera({
-        "name": "Camera 2",
-        "ip_address": "192.168.1.101"
-    })
+    camera1_id, camera2_id = camera_manager.add_cameras([
+        {"name": "Camera 1", "ip_address": "192.168.1.100"},
+        {"name": "Camera 2", "ip_address": "192.168.1.101"}
+    ])
     
     # Initial refresh
     tree_view.refresh_tree()
@@ -236,14 +181,56 @@ def test_refresh_tree_preserves_selection(tree_view, camera_manager):
     assert tree_view.get_selected_camera_id() == camera1_id
 
 
-def test_camera_selected_signal(tree_view, camera_manager, qtbot):
-    """Test that camera_selected signal is emitted on click."""
-    # Add a camera
-    camera_id = camera_manager.add_camera({
-        "name": "Test Camera",
+def test_refresh_tree_updates_in_place(tree_view, camera_manager):
+    """Test that refresh keeps existing items and only applies changes."""
+    camera1_id, camera2_id = camera_manager.add_cameras([
+        {"name": "Camera 1", "ip_address": "192.168.1.100"},
+        {"name": "Camera 2", "ip_address": "192.168.1.101"}
+    ])
+    tree_view.refresh_tree()
+    item1 = tree_view.camera_items[camera1_id]
+    
+    # Rename one camera and remove the other
+    camera_manager.get_camera(camera1_id).name = "Renamed"
+    camera_manager.remove_camera(camera2_id)
+    tree_view.refresh_tree()
+    
+    assert tree_view.camera_items[camera1_id] is item1
+    assert "Renamed" in item1.text(0)
+    assert camera2_id not in tree_view.camera_items
+    assert tree_view.location_nodes["Default"].childCount() == 1
+
+
+def test_add_and_remove_single_camera(tree_view, camera_manager):
+    """Test adding and removing one camera item without a full refresh."""
+    camera1_id = camera_manager.add_camera({
+        "name": "Camera 1",
         "ip_address": "192.168.1.100"
     })
-    camera = camera_manager.get_camera(camera_id)
+    tree_view.refresh_tree()
+    item1 = tree_view.camera_items[camera1_id]
+    
+    camera2_id = camera_manager.add_camera({
+        "name": "Camera 2",
+        "ip_address": "192.168.1.101",
+        "location": "Garage"
+    })
+    tree_view.add_camera(camera2_id)
+    
+    assert tree_view.camera_items[camera1_id] is item1
+    assert tree_view.camera_items[camera2_id].parent() is tree_view.location_nodes["Garage"]
+    
+    # Removing the last camera of a location also removes the location node
+    tree_view.remove_camera(camera2_id)
+    assert camera2_id not in tree_view.camera_items
+    assert "Garage" not in tree_view.location_nodes
+    assert tree_view.topLevelItemCount() == 1
+
+
+def test_camera_selected_signal(tree_view, make_camera, qtbot):
+    """Test that camera_selected signal is emitted on click."""
+    # Add a camera
+    camera = make_camera()
     camera_item = tree_view.add_camera_to_location(camera, "Test")
     
     # Click the camera item
@@ -251,17 +238,13 @@ def test_camera_selected_signal(tree_view, camera_manager, qtbot):
         tree_view.itemClicked.emit(camera_item, 0)
     
     # Verify signal was emitted with correct camera ID
-    assert blocker.args == [camera_id]
+    assert blocker.args == [camera.id]
 
 
-def test_camera_double_clicked_signal(tree_view, camera_manager, qtbot):
+def test_camera_double_clicked_signal(tree_view, make_camera, qtbot):
     """Test that camera_double_clicked signal is emitted on double-click."""
     # Add a camera
-    camera_id = camera_manager.add_camera({
-        "name": "Test Camera",
-        "ip_address": "192.168.1.100"
-    })
-    camera = camera_manager.get_camera(camera_id)
+    camera = make_camera()
     camera_item = tree_view.add_camera_to_location(camera, "Test")
     
     # Double-click the camera item
@@ -269,7 +252,7 @@ def test_camera_double_clicked_signal(tree_view, camera_manager, qtbot):
         tree_view.itemDoubleClicked.emit(camera_item, 0)
     
     # Verify signal was emitted with correct camera ID
-    assert blocker.args == [camera_id]
+    assert blocker.args == [camera.id]
 
 
 def test_location_click_no_signal(tree_view, qtbot):
@@ -283,24 +266,19 @@ def test_location_click_no_signal(tree_view, qtbot):
             tree_view.itemClicked.emit(location_item, 0)
 
 
-def test_update_camera_state(tree_view, camera_manager):
+def test_update_camera_state(tree_view, make_camera):
     """Test updating camera state display."""
     # Add a camera
-    camera_id = camera_manager.add_camera({
-        "name": "Test Camera",
-        "ip_address": "192.168.1.100"
-    })
-    camera = camera_manager.get_camera(camera_id)
-    camera.state = CameraState.STOPPED
+    camera = make_camera(state=CameraState.STOPPED)
     tree_view.add_camera_to_location(camera, "Test")
     
     # Verify initial state
-    camera_item = tree_view.camera_items[camera_id]
+    camera_item = tree_view.camera_items[camera.id]
     assert "⚪" in camera_item.text(0)
     
     # Change camera state
     camera.state = CameraState.RUNNING
-    tree_view.update_camera_state(camera_id)
+    tree_view.update_camera_state(camera.id)
     
     # Verify updated state
     assert "🟢" in camera_item.text(0)
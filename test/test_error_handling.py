@@ -10,8 +10,10 @@ This script tests:
 """
 
 import sys
+import time
 from PyQt5.QtWidgets import QApplication
 from PyQt5.QtCore import QSettings
+import ip_camera_player
 from ip_camera_player import (
     CameraInstance, CameraManager, CameraPanel, CameraConfigDialog,
     CameraState
@@ -83,14 +85,10 @@ def test_camera_manager_storage_error_handling():
     print("✓ CameraManager storage error handling works correctly")
 
 
-def test_config_validation():
+def test_config_validation(qapp):
     """Test configuration validation in CameraConfigDialog."""
     print("\nTesting configuration validation...")
     
-    app = QApplication.instance()
-    if app is None:
-        app = QApplication(sys.argv)
-    
     dialog = CameraConfigDialog()
     
     # Test empty name validation
@@ -127,14 +125,10 @@ def test_config_validation():
     print("✓ Configuration validation works correctly")
 
 
-def test_camera_panel_error_display():
+def test_camera_panel_error_display(qapp):
     """Test that CameraPanel displays errors correctly."""
     print("\nTesting CameraPanel error display...")
     
-    app = QApplication.instance()
-    if app is None:
-        app = QApplication(sys.argv)
-    
     camera = CameraInstance(
         name="Test Camera",
         ip_address="192.168.1.100"
@@ -159,6 +153,91 @@ def test_camera_panel_error_display():
     print("✓ CameraPanel error display works correctly")
 
 
+class _FailingCapture:
+    """Stand-in for cv2.VideoCapture that opens but never delivers a frame."""
+    
+    opened = 0
+    
+    def __init__(self, url):
+        _FailingCapture.opened += 1
+    
+    def isOpened(self):
+        return True
+    
+    def set(self, prop, value):
+        return True
+    
+    def get(self, prop):
+        return 0
+    
+    def read(self):
+        return False, None
+    
+    def release(self):
+        pass
+
+
+def test_camera_retry_after_read_error(qapp, monkeypatch):
+    """Test that a stream stopped by a frame read error can be restarted."""
+    print("\nTesting camera retry after a frame read error...")
+    
+    monkeypatch.setattr(ip_camera_player.cv2, "VideoCapture", _FailingCapture)
+    _FailingCapture.opened = 0
+    
+    camera = CameraInstance(
+        name="Test Camera",
+        ip_address="192.168.1.100",
+        connection_timeout=2
+    )
+    
+    camera.start_stream()
+    assert camera.stream_thread.wait(5000), "Stream thread should stop on read error"
+    
+    # Retrying reuses the thread, which must open the capture again
+    camera.restart_stream()
+    assert camera.stream_thread.wait(5000), "Restarted stream thread should stop on read error"
+    assert _FailingCapture.opened == 2, "Capture should be reopened on retry"
+    
+    print("✓ Camera retry after a frame read error works correctly")
+
+
+class _SlowCapture(_FailingCapture):
+    """Capture stand-in that takes longer to open than the connection timeout."""
+    
+    released = 0
+    
+    def __init__(self, url):
+        time.sleep(1.5)
+        super().__init__(url)
+    
+    def release(self):
+        _SlowCapture.released += 1
+
+
+def test_camera_timeout_releases_late_capture(qapp, monkeypatch):
+    """Test that a capture opened after the connection timeout is released."""
+    print("\nTesting capture release after a connection timeout...")
+    
+    monkeypatch.setattr(ip_camera_player.cv2, "VideoCapture", _SlowCapture)
+    _SlowCapture.released = 0
+    
+    camera = CameraInstance(
+        name="Test Camera",
+        ip_address="192.168.1.100",
+        connection_timeout=1
+    )
+    
+    camera.start_stream()
+    assert camera.stream_thread.wait(5000), "Stream thread should stop on timeout"
+    assert _SlowCapture.released == 0, "Capture should not be open yet"
+    
+    # Let the abandoned connection attempt finish
+    time.sleep(1.0)
+    assert _SlowCapture.released == 1, "Late capture should be released"
+    
+    print("✓ Late capture is released after a connection timeout")
+
+
 def run_all_tests():
     """Run all error handling tests."""
     print("=" * 60)
@@ -168,8 +247,9 @@ def run_all_tests():
     try:
         test_camera_instance_timeout()
         test_camera_manager_storage_error_handling()
-        test_config_validation()
-        test_camera_panel_error_display()
+        qapp = QApplication.instance() or QApplication(sys.argv)
+        test_config_validation(qapp)
+        test_camera_panel_error_display(qapp)
         
         print("\n" + "=" * 60)
         print("All tests passed! ✓")
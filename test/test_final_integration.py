@@ -14,28 +14,17 @@ This test suite validates the complete workflow with multiple cameras including:
 Requirements tested: All requirements from the specification
 """
 
-import sys
 import pytest
-from PyQt5.QtWidgets import QApplication
 from PyQt5.QtCore import QSettings, Qt, QPoint
 from PyQt5.QtTest import QTest
 from ip_camera_player import (
     CameraInstance, CameraManager, CameraPanel, CameraGridLayout,
-    CameraState, migrate_settings
+    CameraState, SettingsWriter, migrate_settings, parse_resolution
 )
 import json
 import time
 
 
-@pytest.fixture(scope="function")
-def qapp():
-    """Create QApplication instance for tests."""
-    app = QApplication.instance()
-    if app is None:
-        app = QApplication(sys.argv)
-    yield app
-
-
 @pytest.fixture
 def settings(tmp_path):
     """Create temporary QSettings for testing."""
@@ -137,6 +126,22 @@ class TestCompleteWorkflow:
         assert hasattr(camera2, 'stop_stream')
         assert hasattr(camera2, 'pause_stream')
     
+    def test_update_camera_from_dict(self):
+        """Test applying an edited configuration to a camera in one step."""
+        camera = CameraInstance(name="Camera 1", ip_address="192.168.1.100")
+        
+        assert camera.update_from_dict({"name": "Camera 1", "port": 554}) is False
+        
+        assert camera.update_from_dict({
+            "name": "Renamed",
+            "location": "",
+            "resolution": [1280, 720]
+        }) is True
+        assert camera.name == "Renamed"
+        assert camera.location == "Default"
+        assert camera.resolution == (1280, 720)
+        assert camera.ip_address == "192.168.1.100"
+    
     def test_selection_switching(self, camera_manager):
         """Test selection switching between cameras."""
         # Add three cameras
@@ -191,6 +196,23 @@ class TestCompleteWorkflow:
         assert cameras[1].id == camera2_id
         assert cameras[2].id == camera1_id
     
+    def test_index_of_follows_list_changes(self, camera_manager):
+        """Test camera index lookups stay correct after reorder and removal."""
+        camera1_id = camera_manager.add_camera({"name": "Camera 1", "ip_address": "192.168.1.100"})
+        camera2_id = camera_manager.add_camera({"name": "Camera 2", "ip_address": "192.168.1.101"})
+        camera3_id = camera_manager.add_camera({"name": "Camera 3", "ip_address": "192.168.1.102"})
+        
+        assert camera_manager.index_of(camera3_id) == 2
+        
+        camera_manager.reorder_cameras(camera3_id, 0)
+        assert camera_manager.index_of(camera3_id) == 0
+        assert camera_manager.index_of(camera1_id) == 1
+        
+        camera_manager.remove_camera(camera1_id)
+        assert camera_manager.index_of(camera1_id) == -1
+        assert camera_manager.index_of(camera2_id) == 1
+        assert camera_manager.get_camera(camera2_id).name == "Camera 2"
+    
     def test_fullscreen_mode(self, qapp):
         """Test fullscreen mode for camera panels."""
         # Create camera instances
@@ -224,6 +246,51 @@ class TestCompleteWorkflow:
 class TestSettingsPersistence:
     """Test settings persistence across application sessions."""
     
+    def test_add_cameras_saves_once(self, settings):
+        """Test adding several cameras in one call with a single save."""
+        manager1 = CameraManager(settings)
+        added = []
+        manager1.camera_added.connect(added.append)
+        saves = []
+        save_to_settings = manager1.save_to_settings
+        manager1.save_to_settings = lambda: saves.append(1) or save_to_settings()
+        
+        camera_ids = manager1.add_cameras([
+            {"name": "Bulk Camera 1", "ip_address": "192.168.1.100", "password": "pass1"},
+            {"name": "", "ip_address": "192.168.1.101"},
+            {"name": "Bulk Camera 3", "ip_address": "192.168.1.102", "password": "pass3"},
+        ])
+        
+        # Invalid configurations are skipped and reported as None
+        assert camera_ids[1] is None
+        assert added == [camera_ids[0], camera_ids[2]]
+        assert len(saves) == 1
+        
+        # Create new manager and load from settings
+        manager2 = CameraManager(settings)
+        assert manager2.load_from_settings()
+        cameras = manager2.get_all_cameras()
+        assert [camera.name for camera in cameras] == ["Bulk Camera 1", "Bulk Camera 3"]
+        assert cameras[1].password == "pass3"
+    
+    def test_save_with_settings_writer(self, settings):
+        """Test that saving through a SettingsWriter reports the queued write."""
+        manager1 = CameraManager(settings)
+        writer = SettingsWriter(settings)
+        manager1.set_settings_writer(writer)
+        
+        # A failure left by an earlier sync does not fail the new save
+        writer.status = QSettings.AccessError
+        assert manager1.add_camera({"name": "Queued Camera", "ip_address": "192.168.1.100"})
+        assert manager1.save_to_settings()
+        
+        # The sync result is reported once the write is flushed
+        assert manager1.flush_settings()
+        
+        manager2 = CameraManager(QSettings(settings.fileName(), QSettings.IniFormat))
+        assert manager2.load_from_settings()
+        assert [camera.name for camera in manager2.get_all_cameras()] == ["Queued Camera"]
+    
     def test_add_cameras_and_reload(self, settings):
         """Test adding cameras and reloading from settings."""
         # Create camera manager and add cameras
@@ -312,6 +379,20 @@ class TestSettingsPersistence:
         selected = manager2.get_selected_camera()
         assert selected is not None
         assert selected.name == "Camera 2"
+    
+    def test_unchanged_save_is_not_rewritten(self, settings):
+        """Test that saving unchanged cameras does not schedule another sync."""
+        manager = CameraManager(settings)
+        manager.add_camera({"name": "Camera 1", "ip_address": "192.168.1.100"})
+        
+        # The add schedules a deferred sync; flushing writes it out now
+        assert manager._flush_timer.isActive()
+        assert manager.flush_settings()
+        assert not manager._flush_timer.isActive()
+        
+        # Nothing changed, so nothing is rewritten or re-synced
+        assert manager.save_to_settings()
+        assert not manager._flush_timer.isActive()
 
 
 class TestErrorScenarios:
@@ -494,6 +575,23 @@ class TestSettingsMigration:
         # Verify old keys are removed
         assert not settings.contains('ip')
         assert not settings.contains('user')
+    
+    def test_migrate_legacy_resolution_string(self, settings):
+        """Test the legacy resolution string is converted to integer keys."""
+        settings.setValue('cameras', '[]')
+        settings.setValue('video_resolution', '(1280, 720)')
+        
+        migrate_settings(settings)
+        
+        assert not settings.contains('video_resolution')
+        assert settings.value('res_w', type=int) == 1280
+        assert settings.value('res_h', type=int) == 720
+    
+    def test_parse_resolution_rejects_non_literals(self):
+        """Test that resolution strings are parsed without evaluating code."""
+        assert parse_resolution('(640, 480)') == (640, 480)
+        assert parse_resolution('') == (1920, 1080)
+        assert parse_resolution('__import__("os").getcwd()') == (1920, 1080)
 
 
 class TestStorageErrorHandling:
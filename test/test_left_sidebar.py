@@ -5,24 +5,14 @@ Tests the basic functionality of the LeftSidebar widget including
 collapse/expand behavior and tree view integration.
 """
 
-import sys
 import pytest
-from PyQt5.QtWidgets import QApplication, QLabel
+from PyQt5.QtWidgets import QLabel
 from PyQt5.QtCore import Qt
 
 # Import the component to test
 from ip_camera_player import LeftSidebar
 
 
-@pytest.fixture(scope="module")
-def qapp():
-    """Create QApplication instance for tests."""
-    app = QApplication.instance()
-    if app is None:
-        app = QApplication(sys.argv)
-    yield app
-
-
 @pytest.fixture
 def sidebar(qapp):
     """Create a LeftSidebar instance for testing."""
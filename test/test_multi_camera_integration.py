@@ -12,10 +12,8 @@ from PyQt5.QtCore import QSettings
 from ip_camera_player import Windows, CameraManager, migrate_settings
 
 
-def test_main_window_initialization():
+def test_main_window_initialization(qapp):
     """Test that MainWindow initializes correctly with multi-camera support."""
-    app = QApplication(sys.argv)
-    
     # Create main window
     window = Windows()
     
@@ -36,9 +34,8 @@ def test_main_window_initialization():
     return window
 
 
-def test_camera_manager_integration():
+def test_camera_manager_integration(qapp):
     """Test that CameraManager is properly integrated."""
-    app = QApplication(sys.argv)
     window = Windows()
     
     # Test adding a camera
@@ -68,9 +65,8 @@ def test_camera_manager_integration():
     return window
 
 
-def test_camera_selection():
+def test_camera_selection(qapp):
     """Test camera selection functionality."""
-    app = QApplication(sys.argv)
     window = Windows()
     
     # Add a test camera
@@ -137,10 +133,8 @@ def test_settings_migration():
     settings.clear()
 
 
-def test_control_buttons_state():
+def test_control_buttons_state(qapp):
     """Test that control buttons are properly enabled/disabled based on selection."""
-    app = QApplication(sys.argv)
-    
     # Clear any existing settings to start fresh
     settings = QSettings('IP Camera Player', 'AppSettings')
     settings.clear()
@@ -182,11 +176,12 @@ def main():
     print("Running multi-camera integration tests...\n")
     
     try:
+        qapp = QApplication.instance() or QApplication(sys.argv)
         test_settings_migration()
-        test_main_window_initialization()
-        test_camera_manager_integration()
-        test_camera_selection()
-        test_control_buttons_state()
+        test_main_window_initialization(qapp)
+        test_camera_manager_integration(qapp)
+        test_camera_selection(qapp)
+        test_control_buttons_state(qapp)
         
         print("\n✅ All tests passed!")
         return 0
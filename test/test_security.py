@@ -63,6 +63,9 @@ def test_encryption_consistency():
     assert decrypt_password(encrypted1) == password
     assert decrypt_password(encrypted2) == password
     
+    # The key is derived once and reused
+    assert PasswordEncryption._get_encryption_key.cache_info().hits > 0
+    
     print("  ✓ Encryption is consistent")
     print("✓ Encryption consistency tests passed\n")
 
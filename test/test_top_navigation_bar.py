@@ -12,21 +12,12 @@ import pytest
 # Add parent directory to path
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from PyQt5.QtWidgets import QApplication, QLabel
+from PyQt5.QtWidgets import QLabel
 from PyQt5.QtTest import QTest
 from PyQt5.QtCore import Qt
 from ip_camera_player import TopNavigationBar
 
 
-@pytest.fixture(scope="module")
-def qapp():
-    """Create QApplication instance for tests."""
-    app = QApplication.instance()
-    if app is None:
-        app = QApplication(sys.argv)
-    yield app
-
-
 @pytest.fixture
 def nav_bar(qapp):
     """Create TopNavigationBar instance for testing."""
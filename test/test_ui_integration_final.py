@@ -13,28 +13,18 @@ This test suite validates the complete UI integration including:
 Requirements tested: 11.1, 11.2, 11.3, 11.4, 11.5, 12.1, 12.2, 12.3, 12.4, 13.1, 13.2, 13.3, 13.4, 13.5
 """
 
-import sys
 import pytest
 from PyQt5.QtWidgets import QApplication
-from PyQt5.QtCore import QSettings, Qt, QPoint, QSize
+from PyQt5.QtCore import QSettings, Qt, QPoint, QSize, QThreadPool
 from PyQt5.QtTest import QTest
-from PyQt5.QtGui import QPalette
+from PyQt5.QtGui import QPalette, QImage
 from ip_camera_player import (
     Windows, CameraManager, CameraInstance, TopNavigationBar,
-    LeftSidebar, CameraTreeView, CameraPanel
+    LeftSidebar, CameraTreeView, CameraPanel, SnapshotSaveTask
 )
 import json
 
 
-@pytest.fixture(scope="function")
-def qapp():
-    """Create QApplication instance for tests."""
-    app = QApplication.instance()
-    if app is None:
-        app = QApplication(sys.argv)
-    yield app
-
-
 @pytest.fixture
 def settings(tmp_path):
     """Create temporary QSettings for testing."""
@@ -599,6 +589,42 @@ class TestMenuBarFunctionality:
                 nav_bar.update_status(indicator_name, "Test Value")
             except Exception as e:
                 pytest.fail(f"Status update failed: {e}")
+    
+    def test_status_bar_updates_are_coalesced(self, main_window):
+        """Verify rapid status bar updates are merged into the latest values."""
+        # Let the status shown during start-up expire
+        QTest.qWait(300)
+        
+        main_window.update_status_bar("First", "rtsp://first", "640x360")
+        assert main_window.status_bar_message_label.text().startswith("Status: First")
+        
+        # Updates within the hold-off period are not shown yet
+        main_window.update_status_bar("Second", "", "")
+        main_window.update_status_bar("Third", "", "1280x720")
+        assert main_window.status_bar_message_label.text().startswith("Status: First")
+        
+        # The latest values are shown once the hold-off period ends
+        QTest.qWait(300)
+        assert main_window.status_bar_message_label.text().startswith("Status: Third")
+        assert main_window.status_bar_url.text() == "URL: rtsp://first"
+        assert main_window.status_bar_resolution.text() == "Resolution: 1280x720"
+    
+    def test_snapshot_saved_in_thread_pool(self, main_window, tmp_path):
+        """Verify snapshots are written by a pool task that reports back."""
+        image = QImage(64, 48, QImage.Format_RGB32)
+        image.fill(Qt.black)
+        path = str(tmp_path / "snapshot.png")
+        
+        results = []
+        task = SnapshotSaveTask(image, path, "Pool Camera")
+        task.signals.finished.connect(lambda *args: results.append(args))
+        task.signals.finished.connect(main_window._on_snapshot_saved)
+        QThreadPool.globalInstance().start(task)
+        QThreadPool.globalInstance().waitForDone()
+        QApplication.processEvents()
+        
+        assert results == [("Pool Camera", path, True)]
+        assert QImage(path).size() == QSize(64, 48)
 
 
 class TestCompleteUIIntegration: